@@ -2,7 +2,9 @@
 Components package for the Customer Analytics Dashboard.
 """
 
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, List
+from bisect import bisect_right
+from importlib import import_module
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -20,10 +22,20 @@ class ComponentRegistry:
     
     def __init__(self):
         self._components: Dict[str, Component] = {}
+        # Components kept sorted by order as they register, with their orders alongside for bisect
+        self._sorted: List[Component] = []
+        self._orders: List[int] = []
     
     def register(self, component: Component) -> None:
         """Register a new component."""
+        if component.name in self._components:
+            index = self._sorted.index(self._components[component.name])
+            del self._sorted[index]
+            del self._orders[index]
         self._components[component.name] = component
+        index = bisect_right(self._orders, component.order)
+        self._sorted.insert(index, component)
+        self._orders.insert(index, component.order)
     
     def get_component(self, name: str) -> Component:
         """Get a component by name."""
@@ -31,7 +43,8 @@ class ComponentRegistry:
     
     def get_all_components(self) -> list[Component]:
         """Get all components sorted by their order."""
-        return sorted(self._components.values(), key=lambda x: x.order)
+        # A copy, so callers can't reorder or drop entries in the registry
+        return list(self._sorted)
     
     def render_component(self, name: str, *args, **kwargs) -> Any:
         """Render a component by name."""
@@ -40,13 +53,26 @@ class ComponentRegistry:
 # Create the global registry instance
 registry = ComponentRegistry()
 
-# Import all component render functions
-from .overview import render_overview
-from .sentiment_experience import render_sentiment_experience
-from .support_ops import render_support_ops_dashboard
-from .product_feedback import render_product_feedback
-from .segmentation import render_segmentation
-from .cortex_analyst import render_cortex_analyst_tab
+def _lazy_render(module_name: str, func_name: str) -> Callable:
+    """Return a render function that imports its component module on first use.
+    
+    Only the selected dashboard section is rendered, so the other components'
+    modules (and the plotting libraries they pull in) are not imported until
+    someone opens them.
+    """
+    def render(*args, **kwargs) -> Any:
+        module = import_module(f"{__name__}.{module_name}")
+        return getattr(module, func_name)(*args, **kwargs)
+    render.__name__ = func_name
+    return render
+
+# Component render functions, imported lazily
+render_overview = _lazy_render("overview", "render_overview")
+render_sentiment_experience = _lazy_render("sentiment_experience", "render_sentiment_experience")
+render_support_ops_dashboard = _lazy_render("support_ops", "render_support_ops_dashboard")
+render_product_feedback = _lazy_render("product_feedback", "render_product_feedback")
+render_segmentation = _lazy_render("segmentation", "render_segmentation")
+render_cortex_analyst_tab = _lazy_render("cortex_analyst", "render_cortex_analyst_tab")
 
 # Register all components
 registry.register(Component(
@@ -679,10 +679,14 @@ def display_charts_for_df(df: pd.DataFrame, chart_key_prefix: str):
 
     # --- Infer default chart type ---
     default_chart_type_index = 0 # Default to Bar Chart
-    x_is_datetime = pd.api.types.is_datetime64_any_dtype(plot_df[x_axis])
-    x_is_numeric = pd.api.types.is_numeric_dtype(plot_df[x_axis])
-    x_is_categorical = pd.api.types.is_categorical_dtype(plot_df[x_axis]) or pd.api.types.is_object_dtype(plot_df[x_axis])
-    y_is_numeric = pd.api.types.is_numeric_dtype(plot_df[y_axis]) if y_axis in plot_df.columns else False
+    # Look the dtypes up once and check their kind directly instead of selecting
+    # the column again for every pd.api.types check.
+    dtypes = plot_df.dtypes
+    x_dtype = dtypes[x_axis]
+    x_is_datetime = x_dtype.kind == 'M'
+    x_is_numeric = x_dtype.kind in 'biufc'
+    x_is_categorical = isinstance(x_dtype, pd.CategoricalDtype) or x_dtype.kind == 'O'
+    y_is_numeric = dtypes[y_axis].kind in 'biufc' if y_axis in plot_df.columns else False
 
     chart_options = ["Bar Chart", "Line Chart", "Area Chart", "Scatter Plot"]
     chart_guidance = {
@@ -714,8 +718,8 @@ def display_charts_for_df(df: pd.DataFrame, chart_key_prefix: str):
         # Group by X-axis and sum/mean Y-axis if X is categorical and Y is numeric
         # This helps avoid overplotting or errors with altair/st charts
         df_for_agg_charts = plot_df # Start with plot_df (which is a copy of original df)
-        if pd.api.types.is_categorical_dtype(plot_df[x_axis]) or pd.api.types.is_object_dtype(plot_df[x_axis]):
-            if y_axis in plot_df.columns and pd.api.types.is_numeric_dtype(plot_df[y_axis]): # Check if y_axis is now numeric
+        if x_is_categorical:
+            if y_is_numeric: # Check if y_axis is now numeric
                 # Check if multiple y-values per x-category
                 if plot_df.groupby(x_axis)[y_axis].count().max() > 1:
                     agg_func = st.radio("Aggregate Y-axis by:", ("Sum", "Mean"), horizontal=True, key=f"{chart_key_prefix}_agg")
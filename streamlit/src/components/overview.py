@@ -7,7 +7,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import altair as alt
 import pandas as pd
-from utils.database import snowflake_conn
+from utils.database import snowflake_conn, run_concurrently
 from utils.kpi_cards import render_kpis
 from utils.debug import display_debug_info
 from utils.theme import get_current_theme
@@ -47,16 +47,8 @@ def load_kpi_data() -> pd.DataFrame:
         pd.DataFrame: KPI data
     """
     kpi_query = "overview/kpis.sql"
-    results = snowflake_conn.execute_query(kpi_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=kpi_query,
-            params={},
-            results=df,
-            query_name="KPI Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(kpi_query).to_pandas()
     
     return df
 
@@ -68,16 +60,8 @@ def load_trend_data() -> pd.DataFrame:
         pd.DataFrame: Trend data
     """
     trend_query = "overview/sentiment_trend.sql"
-    results = snowflake_conn.execute_query(trend_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=trend_query,
-            params={},
-            results=df,
-            query_name="Sentiment Trend Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(trend_query).to_pandas()
     
     return df
 
@@ -98,8 +82,8 @@ def load_distribution_data(start_date: str, end_date: str) -> pd.DataFrame:
         "end_date": end_date
     }
     
-    results = snowflake_conn.execute_query(dist_query, dist_params)
-    df = pd.DataFrame(results)
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(dist_query, dist_params).to_pandas()
     
     if st.session_state.get('debug_mode', False):
         display_debug_info(
@@ -119,16 +103,8 @@ def load_risk_data() -> pd.DataFrame:
         pd.DataFrame: Risk data
     """
     risk_query = "overview/churn_risk_breakdown.sql"
-    results = snowflake_conn.execute_query(risk_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=risk_query,
-            params={},
-            results=df,
-            query_name="Churn Risk Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(risk_query).to_pandas()
     
     return df
 
@@ -140,16 +116,8 @@ def load_interaction_trend() -> pd.DataFrame:
         pd.DataFrame: Interaction trend data
     """
     trend_query = "overview/interaction_trend.sql"
-    results = snowflake_conn.execute_query(trend_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=trend_query,
-            params={},
-            results=df,
-            query_name="Interaction Trend Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(trend_query).to_pandas()
     
     return df
 
@@ -161,16 +129,8 @@ def load_risk_trend() -> pd.DataFrame:
         pd.DataFrame: Risk trend data
     """
     trend_query = "overview/risk_trend.sql"
-    results = snowflake_conn.execute_query(trend_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=trend_query,
-            params={},
-            results=df,
-            query_name="Risk Trend Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(trend_query).to_pandas()
     
     return df
 
@@ -182,16 +142,8 @@ def load_rating_trend() -> pd.DataFrame:
         pd.DataFrame: Rating trend data
     """
     trend_query = "product_feedback/rating_trend.sql"
-    results = snowflake_conn.execute_query(trend_query)
-    df = pd.DataFrame(results)
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=trend_query,
-            params={},
-            results=df,
-            query_name="Rating Trend Query"
-        )
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(trend_query).to_pandas()
     
     return df
 
@@ -282,14 +234,22 @@ def render_overview(filters: dict, debug_mode: bool = False) -> None:
     </div>
     """, unsafe_allow_html=True)
     
-    # Load all data first
+    # Load all data first; the queries are independent, so fetch them concurrently
     with st.spinner("Loading overview data..."):
-        kpi_data = load_kpi_data()
-        sentiment_trend = load_trend_data()
-        interaction_trend = load_interaction_trend()
-        risk_trend = load_risk_trend()
-        rating_trend = load_rating_trend()
-        risk_data = load_risk_data()
+        results = run_concurrently({
+            'kpis': load_kpi_data,
+            'sentiment_trend': load_trend_data,
+            'interaction_trend': load_interaction_trend,
+            'risk_trend': load_risk_trend,
+            'rating_trend': load_rating_trend,
+            'risk': load_risk_data
+        })
+        kpi_data = results['kpis']
+        sentiment_trend = results['sentiment_trend']
+        interaction_trend = results['interaction_trend']
+        risk_trend = results['risk_trend']
+        rating_trend = results['rating_trend']
+        risk_data = results['risk']
     
     # Display debug information for filters and all queries if debug mode is enabled
     if st.session_state.get('debug_mode', False):
@@ -318,7 +278,7 @@ def render_overview(filters: dict, debug_mode: bool = False) -> None:
     kpis = [
         {
             "label": "Avg Sentiment",
-            "value": f"{kpi_data['AVG_SENTIMENT'].iloc[0]:.2f}" if not kpi_data.empty and kpi_data['AVG_SENTIMENT'].iloc[0] is not None else "N/A",
+            "value": f"{kpi_data['AVG_SENTIMENT'].iloc[0]:.2f}" if not kpi_data.empty and pd.notna(kpi_data['AVG_SENTIMENT'].iloc[0]) else "N/A",
             "delta": calculate_delta(get_trend_data(sentiment_trend, 'AVG_SENTIMENT')),
             "timeframe": "Week",
             "help": """
@@ -331,7 +291,7 @@ def render_overview(filters: dict, debug_mode: bool = False) -> None:
         },
         {
             "label": "Total Interactions",
-            "value": f"{kpi_data['TOTAL_INTERACTIONS'].iloc[0]:,}" if not kpi_data.empty and kpi_data['TOTAL_INTERACTIONS'].iloc[0] is not None else "N/A",
+            "value": f"{kpi_data['TOTAL_INTERACTIONS'].iloc[0]:,}" if not kpi_data.empty and pd.notna(kpi_data['TOTAL_INTERACTIONS'].iloc[0]) else "N/A",
             "delta": calculate_delta(get_trend_data(interaction_trend, 'INTERACTION_COUNT'), is_count_metric=True),
             "timeframe": "Week",
             "help": """
@@ -345,7 +305,7 @@ def render_overview(filters: dict, debug_mode: bool = False) -> None:
         },
         {
             "label": "High Risk %",
-            "value": f"{kpi_data['HIGH_RISK_PCT'].iloc[0]:.1f}%" if not kpi_data.empty and kpi_data['HIGH_RISK_PCT'].iloc[0] is not None else "N/A",
+            "value": f"{kpi_data['HIGH_RISK_PCT'].iloc[0]:.1f}%" if not kpi_data.empty and pd.notna(kpi_data['HIGH_RISK_PCT'].iloc[0]) else "N/A",
             "delta": calculate_delta(get_trend_data(risk_trend, 'HIGH_RISK_PCT')),
             "timeframe": "Week",
             "help": """
@@ -359,7 +319,7 @@ def render_overview(filters: dict, debug_mode: bool = False) -> None:
         },
         {
             "label": "Avg Rating",
-            "value": f"{kpi_data['AVG_RATING'].iloc[0]:.1f}" if not kpi_data.empty and kpi_data['AVG_RATING'].iloc[0] is not None else "N/A",
+            "value": f"{kpi_data['AVG_RATING'].iloc[0]:.1f}" if not kpi_data.empty and pd.notna(kpi_data['AVG_RATING'].iloc[0]) else "N/A",
             "delta": calculate_delta(get_trend_data(rating_trend, 'AVG_RATING')),
             "timeframe": "Week",
             "help": """
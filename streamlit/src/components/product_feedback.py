@@ -1,13 +1,18 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from functools import partial
 import pandas as pd
+import numpy as np
 
-from utils.database import run_query
+from utils.database import snowflake_conn, run_concurrently
 from utils.kpi_cards import render_kpis
 from utils.debug import display_debug_info, read_sql_file
 from utils.theme import get_current_theme
+from utils.export import df_to_csv_bytes
+from utils.timeseries import lttb_downsample, move_mean, move_sum
 
 # Helper functions for trend calculation (copied from support_ops.py)
 def calculate_delta(trend_series, is_count_metric=False):
@@ -21,31 +26,33 @@ def calculate_delta(trend_series, is_count_metric=False):
     if trend_series is None or len(trend_series) < 2:
         return 0
     
+    # Work on the underlying array; plain slicing avoids building intermediate Series
+    vals = np.asarray(trend_series, dtype=np.float64)
+    
     # For count metrics, we want to compare the last 7 days with the previous 7 days
     if is_count_metric:
         # Get the last 14 days of data
-        last_14_days = trend_series.tail(14)
-        if len(last_14_days) < 14:
+        if len(vals) < 14:
             return 0
+        last_14_days = vals[-14:]
             
         # Calculate current week and previous week totals
-        current_week = last_14_days.tail(7).sum()
-        previous_week = last_14_days.head(7).sum()
+        current_week = last_14_days[-7:].sum()
+        previous_week = last_14_days[:7].sum()
         
         if previous_week == 0:
             return 0 # Avoid division by zero
             
         # Calculate percentage change
-        return ((current_week - previous_week) / previous_week) * 100
+        return float((current_week - previous_week) / previous_week * 100)
     else:
         # For other metrics, compare last two values
-        current = trend_series.iloc[-1]
-        previous = trend_series.iloc[-2]
+        current, previous = vals[-1], vals[-2]
         
         if previous == 0:
             return 0 # Avoid division by zero
             
-        return ((current - previous) / abs(previous)) * 100
+        return float((current - previous) / abs(previous) * 100)
 
 def get_smoothed_trend_data(df, column_name, window=30):
     """Get smoothed trend data using a moving average.
@@ -71,40 +78,233 @@ def get_smoothed_trend_data(df, column_name, window=30):
     if data_series.empty:
         return pd.Series(dtype=float) # Return empty series if no data
 
-    return data_series.rolling(window=window, min_periods=1).mean()
+    return move_mean(data_series, window)
 
-# Load data with caching
-@st.cache_data(ttl=300)
-def load_rating_trend():
-    query = "product_feedback/rating_trend.sql"
-    results = run_query(query)
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    return df
+# SQL files backing this tab, keyed by dataset name
+PRODUCT_FEEDBACK_QUERIES = {
+    'rating_trend': "product_feedback/rating_trend.sql",
+    'rating_distribution': "product_feedback/rating_distribution.sql",
+    'sentiment_by_language': "product_feedback/sentiment_by_language.sql",
+    'recent_reviews': "product_feedback/recent_reviews.sql"
+}
 
-@st.cache_data(ttl=300)
-def load_rating_distribution():
-    query = "product_feedback/rating_distribution.sql"
-    results = run_query(query)
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    return df
+# Date ranges shorter than this are shown daily in the language heatmap, longer ones weekly
+HEATMAP_DAILY_MAX_DAYS = 90
 
-@st.cache_data(ttl=300)
-def load_sentiment_by_language():
-    query = "product_feedback/sentiment_by_language.sql"
-    results = run_query(query)
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
+# Load data with caching; the cache is keyed on the SQL path alone.
+# persist="disk" is deliberately not used: Streamlit ignores ttl for persisted
+# caches, so the data would never refresh after the first load.
+@st.cache_data(ttl=300, max_entries=16)
+def load_sql(path: str) -> pd.DataFrame:
+    # Column names come back lowercased from the cursor description
+    df = snowflake_conn.execute_query_pandas(path)
+    # Parse date columns once per load so reruns get ready datetime64 columns
+    for date_column in ('date', 'review_date'):
+        if date_column in df.columns:
+            df[date_column] = pd.to_datetime(df[date_column], cache=True)
+    # Languages repeat heavily, so store them as categories for cheaper filtering and pivots.
+    # The inferred categories are sorted, which also gives the language filter its options.
+    if 'review_language' in df.columns:
+        df['review_language'] = df['review_language'].astype('category')
+    # Free-text columns are held as Arrow-backed strings: smaller than Python
+    # str objects and passed to st.dataframe's Arrow serializer without conversion
+    for text_column in ('review_id', 'review_text', 'review_text_english'):
+        if text_column in df.columns and df[text_column].dtype == object:
+            df[text_column] = df[text_column].astype('string[pyarrow]')
+    # Bucket sentiment once here so the sentiment filter is a single equality check.
+    # Neutral is the inclusive range [-0.2, 0.2]; missing scores get no bucket.
+    if 'sentiment_score' in df.columns:
+        score = df['sentiment_score'].astype(float)
+        df['sentiment_bucket'] = pd.Categorical(
+            np.select([score < -0.2, score <= 0.2, score > 0.2], ['Negative', 'Neutral', 'Positive'], default=''),
+            categories=['Negative', 'Neutral', 'Positive']
+        )
     return df
 
-@st.cache_data(ttl=300)
-def load_recent_reviews():
-    query = "product_feedback/recent_reviews.sql"
-    results = run_query(query)
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    return df
+@st.cache_data(ttl=300, max_entries=4)
+def build_rating_trend_figure(rating_trend_data, avg_rating_trend_smoothed, theme):
+    """
+    Builds the rating trend figure (smoothed average rating line plus review volume bars).
+    
+    Cached on its inputs so reruns with unchanged data and theme skip Plotly's
+    trace validation and layout construction. Returns the figure as a dict,
+    which st.plotly_chart accepts directly.
+    
+    Args:
+        rating_trend_data: DataFrame with date and review_count columns
+        avg_rating_trend_smoothed: Smoothed average rating Series with a DatetimeIndex
+        theme: Theme dictionary from get_current_theme()
+    """
+    # Prepare data for smoothed trend line
+    # avg_rating_trend_smoothed is already a Series with a DatetimeIndex
+    # We need to align its x-values with rating_trend_data['date'] if it's not already aligned
+    # For simplicity, we assume avg_rating_trend_smoothed index matches rating_trend_data['date']
+    # or we can reindex/merge if necessary. The existing code for get_smoothed_trend_data
+    # should produce a series that can be plotted against a date axis.
+
+    # Create figure with secondary y-axis
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+
+    # Collect all traces first and add them in a single batch so Plotly
+    # validates the trace list once instead of once per add_trace call.
+    # NumPy arrays are passed directly to skip the Series-to-array conversion,
+    # as float32 to halve the serialized figure size.
+    # Long daily histories are reduced to a fixed point budget with LTTB,
+    # since the range slider renders every point it is given.
+    traces, secondaries = [], []
+
+    # 1. Smoothed Average Rating Line
+    # Ensure avg_rating_trend_smoothed has a compatible index for plotting
+    # If avg_rating_trend_smoothed is a Series with DatetimeIndex:
+    if avg_rating_trend_smoothed is not None and not avg_rating_trend_smoothed.empty:
+        smoothed_x, smoothed_y = lttb_downsample(
+            avg_rating_trend_smoothed.index.to_numpy(), # Assumes DatetimeIndex
+            avg_rating_trend_smoothed.to_numpy(dtype=np.float32)
+        )
+        traces.append(go.Scatter(
+            x=smoothed_x,
+            y=smoothed_y,
+            name='7-Day Smoothed Avg Rating',
+            mode='lines',
+            line=dict(color=theme.get('secondary', '#ff7f0e')), # Use theme color or default for smoothed line
+            hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br>' +
+                          '<b>Smoothed Avg Rating</b>: %{y:.2f}<extra></extra>'
+        ))
+        secondaries.append(False)
+
+    # 2. Review Volume Bars
+    volume_x, volume_y = lttb_downsample(
+        rating_trend_data['date'].to_numpy(),
+        rating_trend_data['review_count'].to_numpy(dtype=np.float32)
+    )
+    traces.append(go.Bar(
+        x=volume_x,
+        y=volume_y,
+        name='Review Volume',
+        marker=dict(color=theme.get('tertiary', '#2ca02c'), opacity=0.6), # Use theme color or default
+        hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br>' +
+                      '<b>Review Count</b>: %{y}<extra></extra>'
+    ))
+    secondaries.append(True)
+
+    fig.add_traces(traces, secondary_ys=secondaries)
+
+    # 5. Layout Updates (includes X-axis range slider by default)
+    fig.update_layout(
+        title_text='Average Rating and Review Volume Over Time',
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text']),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode="x unified", # Improved hover experience
+        xaxis=dict(
+            title='Date',
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text']),
+            rangeslider_visible=True # Explicitly enable range slider
+        ),
+        yaxis=dict(
+            title='Average Rating (1-5)',
+            range=[1, 5.1], # Optimize Y-Axis Scale
+            dtick=0.5, # Sensible tick marks
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text']),
+            showgrid=True 
+        ),
+        yaxis2=dict(
+            title='Review Volume',
+            overlaying='y',
+            side='right',
+            gridcolor=theme.get('light_border', 'rgba(204,204,204,0.2)'), # Lighter grid for secondary axis
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text']),
+            showgrid=False # Optionally hide secondary grid or make it lighter
+        )
+    )
+    
+    return fig.to_dict()
+
+@st.fragment
+def render_recent_reviews(recent_reviews_data):
+    """
+    Renders the filterable Recent Reviews table.
+    
+    Runs as a fragment so changing the review filters only reruns this block,
+    not the KPI row, charts and download payloads of the whole tab.
+    
+    Args:
+        recent_reviews_data: DataFrame returned by load_sql for recent_reviews.sql
+    """
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        rating_range = st.slider("Rating Range", 1, 5, (1, 5))
+    
+    with col2:
+        sentiment_filter = st.selectbox("Sentiment Filter", 
+                                      ["All", "Positive", "Neutral", "Negative"])
+    
+    with col3:
+        available_languages = ["All"]
+        if not recent_reviews_data.empty and 'review_language' in recent_reviews_data.columns:
+            # Categories are inferred sorted at load time, so this is a metadata read, not a column scan
+            available_languages.extend(recent_reviews_data['review_language'].cat.categories.tolist())
+        selected_language = st.selectbox("Filter by Language", available_languages, key="language_filter")
+
+    # Filter reviews; each boolean mask yields a new frame, so the cached data is never copied or mutated
+    min_selected_rating, max_selected_rating = rating_range
+    filtered_reviews = recent_reviews_data[recent_reviews_data['review_rating'].between(min_selected_rating, max_selected_rating)]
+    
+    if selected_language != "All":
+        filtered_reviews = filtered_reviews[filtered_reviews['review_language'] == selected_language]
+
+    if sentiment_filter != "All":
+        filtered_reviews = filtered_reviews[filtered_reviews['sentiment_bucket'] == sentiment_filter]
+    
+    # Display reviews as a single table instead of one expander per review
+    if filtered_reviews.empty:
+        st.info("No reviews match the selected filters.")
+    else:
+        display_reviews = filtered_reviews[[
+            'review_id', 'review_date', 'review_rating', 'review_language',
+            'sentiment_score', 'review_text', 'review_text_english'
+        ]].assign(
+            review_date=filtered_reviews['review_date'].dt.strftime('%Y-%m-%d'),
+            sentiment_score=filtered_reviews['sentiment_score'].astype(float).round(2)
+        )
+        st.dataframe(
+            display_reviews,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'review_id': st.column_config.TextColumn("Review ID"),
+                'review_date': st.column_config.TextColumn("Date"),
+                'review_rating': st.column_config.NumberColumn("Rating", format="%d ⭐"),
+                'review_language': st.column_config.TextColumn("Language"),
+                'sentiment_score': st.column_config.NumberColumn("Sentiment Score", format="%.2f"),
+                'review_text': st.column_config.TextColumn("Original Text", width="large"),
+                'review_text_english': st.column_config.TextColumn("English Translation", width="large")
+            }
+        )
+
+        # Full text for a single review is rendered on demand rather than for every row
+        if st.checkbox("Show full text for a review", key="show_review_detail"):
+            selected_review_id = st.selectbox(
+                "Review",
+                display_reviews['review_id'].tolist(),
+                key="selected_review_id"
+            )
+            review = display_reviews.loc[display_reviews['review_id'] == selected_review_id].iloc[0]
+            st.write(f"**Date:** {review['review_date']}")
+            st.write(f"**Language:** {review['review_language']}")
+            st.write(f"**Sentiment Score:** {review['sentiment_score']:.2f}")
+            st.write("**Original Text:**")
+            st.write(review['review_text'])
+            if review['review_language'] != 'en':
+                st.write("**English Translation:**")
+                st.write(review['review_text_english'])
 
 def render_product_feedback(filters, debug_mode=False):
     """
@@ -141,15 +341,21 @@ def render_product_feedback(filters, debug_mode=False):
     </div>
     """, unsafe_allow_html=True)
     
-    # Load all data first
+    # Get current theme once for all charts
+    theme = get_current_theme()
+    
+    # Load all data first; the four queries are independent, so fetch them concurrently
     with st.spinner("Loading product feedback data..."):
-        rating_trend_data = load_rating_trend()
-        rating_dist_data = load_rating_distribution()
-        sentiment_lang_data = load_sentiment_by_language()
-        recent_reviews_data = load_recent_reviews()
+        results = run_concurrently({
+            name: partial(load_sql, path) for name, path in PRODUCT_FEEDBACK_QUERIES.items()
+        })
+        rating_trend_data = results['rating_trend']
+        rating_dist_data = results['rating_distribution']
+        sentiment_lang_data = results['sentiment_by_language']
+        recent_reviews_data = results['recent_reviews']
     
     # Display debug information for filters and all queries if debug mode is enabled
-    if st.session_state.get('debug_mode', False):
+    if debug_mode or st.session_state.get('debug_mode', False):
         st.markdown("### Debug Information")
         
         # Show current filters (still displayed, though not used by this tab's queries anymore)
@@ -162,10 +368,10 @@ def render_product_feedback(filters, debug_mode=False):
         
         # Show debug info for each query
         queries = [
-            ("Rating Trend Query", "product_feedback/rating_trend.sql", rating_trend_data),
-            ("Rating Distribution Query", "product_feedback/rating_distribution.sql", rating_dist_data),
-            ("Sentiment by Language Query", "product_feedback/sentiment_by_language.sql", sentiment_lang_data),
-            ("Recent Reviews Query", "product_feedback/recent_reviews.sql", recent_reviews_data)
+            ("Rating Trend Query", PRODUCT_FEEDBACK_QUERIES['rating_trend'], rating_trend_data),
+            ("Rating Distribution Query", PRODUCT_FEEDBACK_QUERIES['rating_distribution'], rating_dist_data),
+            ("Sentiment by Language Query", PRODUCT_FEEDBACK_QUERIES['sentiment_by_language'], sentiment_lang_data),
+            ("Recent Reviews Query", PRODUCT_FEEDBACK_QUERIES['recent_reviews'], recent_reviews_data)
         ]
         
         for query_name, sql_file, results in queries:
@@ -177,6 +383,10 @@ def render_product_feedback(filters, debug_mode=False):
                 query_name=query_name
             )
     
+    if all(df.empty for df in (rating_trend_data, rating_dist_data, sentiment_lang_data, recent_reviews_data)):
+        st.info("No product feedback data available.")
+        return
+    
     # KPI Row
     avg_rating = rating_trend_data['avg_rating'].mean()
     total_reviews = rating_trend_data['review_count'].sum()
@@ -222,22 +432,17 @@ def render_product_feedback(filters, debug_mode=False):
             five_star_reviews_count = five_star_data['count'].sum()
 
     if not recent_reviews_data.empty and 'review_date' in recent_reviews_data.columns and 'review_rating' in recent_reviews_data.columns:
-        # Ensure 'review_date' is datetime for original DataFrame before grouping
-        recent_reviews_data['review_date'] = pd.to_datetime(recent_reviews_data['review_date'])
-        
-        # Create daily counts of 5-star reviews
-        five_star_daily_df = recent_reviews_data[recent_reviews_data['review_rating'] == 5].groupby(
-            pd.Grouper(key='review_date', freq='D')
-        ).size().reset_index(name='count')
-        five_star_daily_df.rename(columns={'review_date': 'date'}, inplace=True)
+        # Create daily counts of 5-star reviews, filling days without any with zero
+        five_star_days = recent_reviews_data.loc[recent_reviews_data['review_rating'] == 5, 'review_date'].dt.floor('D')
 
-        if not five_star_daily_df.empty:
-            # Ensure 'date' column is datetime after manipulation, if not already
-            five_star_daily_df['date'] = pd.to_datetime(five_star_daily_df['date'])
-            daily_counts_series = five_star_daily_df.set_index('date')['count']
+        if not five_star_days.empty:
+            daily_counts_series = five_star_days.value_counts().sort_index().reindex(
+                pd.date_range(five_star_days.min(), five_star_days.max(), freq='D', name='date'),
+                fill_value=0
+            )
             
             # For sparkline: 7-day moving sum of daily 5-star reviews
-            five_star_trend_for_sparkline = daily_counts_series.rolling(window=7, min_periods=1).sum()
+            five_star_trend_for_sparkline = move_sum(daily_counts_series, 7)
             
             # For delta: week-over-week change of actual daily 5-star review counts
             # calculate_delta expects a Series with a DatetimeIndex if it's time-based, 
@@ -283,88 +488,7 @@ def render_product_feedback(filters, debug_mode=False):
     with st.expander("Rating Trend Analysis", expanded=True):
         st.subheader("Rating Trend Over Time")
         if not rating_trend_data.empty:
-            # Get current theme
-            theme = get_current_theme()
-
-            # Ensure 'date' column is datetime for plotting
-            rating_trend_data['date'] = pd.to_datetime(rating_trend_data['date'])
-            
-            # Prepare data for smoothed trend line
-            # avg_rating_trend_smoothed is already a Series with a DatetimeIndex
-            # We need to align its x-values with rating_trend_data['date'] if it's not already aligned
-            # For simplicity, we assume avg_rating_trend_smoothed index matches rating_trend_data['date']
-            # or we can reindex/merge if necessary. The existing code for get_smoothed_trend_data
-            # should produce a series that can be plotted against a date axis.
-
-            # Create figure with secondary y-axis
-            from plotly.subplots import make_subplots
-            fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-            # 1. Smoothed Average Rating Line
-            # Ensure avg_rating_trend_smoothed has a compatible index for plotting
-            # If avg_rating_trend_smoothed is a Series with DatetimeIndex:
-            if avg_rating_trend_smoothed is not None and not avg_rating_trend_smoothed.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=avg_rating_trend_smoothed.index, # Assumes DatetimeIndex
-                        y=avg_rating_trend_smoothed.values,
-                        name='7-Day Smoothed Avg Rating',
-                        mode='lines',
-                        line=dict(color=theme.get('secondary', '#ff7f0e')), # Use theme color or default for smoothed line
-                        hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br>' +
-                                      '<b>Smoothed Avg Rating</b>: %{y:.2f}<extra></extra>'
-                    ),
-                    secondary_y=False,
-                )
-
-            # 2. Review Volume Bars
-            fig.add_trace(
-                go.Bar(
-                    x=rating_trend_data['date'],
-                    y=rating_trend_data['review_count'],
-                    name='Review Volume',
-                    marker=dict(color=theme.get('tertiary', '#2ca02c'), opacity=0.6), # Use theme color or default
-                    hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br>' +
-                                  '<b>Review Count</b>: %{y}<extra></extra>'
-                ),
-                secondary_y=True,
-            )
-            
-            # 5. Layout Updates (includes X-axis range slider by default)
-            fig.update_layout(
-                title_text='Average Rating and Review Volume Over Time',
-                paper_bgcolor=theme['background'],
-                plot_bgcolor=theme['background'],
-                font=dict(color=theme['text']),
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                hovermode="x unified", # Improved hover experience
-                xaxis=dict(
-                    title='Date',
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text']),
-                    rangeslider_visible=True # Explicitly enable range slider
-                ),
-                yaxis=dict(
-                    title='Average Rating (1-5)',
-                    range=[1, 5.1], # Optimize Y-Axis Scale
-                    dtick=0.5, # Sensible tick marks
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text']),
-                    showgrid=True 
-                ),
-                yaxis2=dict(
-                    title='Review Volume',
-                    overlaying='y',
-                    side='right',
-                    gridcolor=theme.get('light_border', 'rgba(204,204,204,0.2)'), # Lighter grid for secondary axis
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text']),
-                    showgrid=False # Optionally hide secondary grid or make it lighter
-                )
-            )
-            
+            fig = build_rating_trend_figure(rating_trend_data, avg_rating_trend_smoothed, theme)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No rating data available for the selected period.")
@@ -373,27 +497,36 @@ def render_product_feedback(filters, debug_mode=False):
     with st.expander("Sentiment by Language", expanded=True):
         st.subheader("Sentiment Analysis by Language")
         if not sentiment_lang_data.empty:
-            pivot_df = sentiment_lang_data.pivot(
-                index='review_language',
-                columns='review_date',
-                values='avg_sentiment'
-            )
+            # Long histories are bucketed by week so the number of heatmap
+            # columns stays bounded; short ranges keep daily resolution
+            date_span = sentiment_lang_data['review_date'].max() - sentiment_lang_data['review_date'].min()
+            heatmap_freq = 'D' if date_span < pd.Timedelta(days=HEATMAP_DAILY_MAX_DAYS) else 'W'
             
-            # Get current theme
-            theme = get_current_theme()
+            # Review-count weighted mean per bucket; groupby/unstack on the categorical
+            # language column only materializes observed (language, date) pairs
+            review_counts = sentiment_lang_data['review_count'].astype(float)
+            heatmap_df = sentiment_lang_data[['review_language', 'review_date']].assign(
+                weighted_sentiment=sentiment_lang_data['avg_sentiment'].astype(float) * review_counts,
+                review_count=review_counts
+            )
+            bucketed = heatmap_df.groupby(
+                ['review_language', pd.Grouper(key='review_date', freq=heatmap_freq)],
+                observed=True
+            )[['weighted_sentiment', 'review_count']].sum()
+            pivot_df = (bucketed['weighted_sentiment'] / bucketed['review_count']).unstack('review_date')
             
             fig = go.Figure(data=go.Heatmap(
-                z=pivot_df.values,
-                x=pivot_df.columns,
-                y=pivot_df.index,
+                z=pivot_df.to_numpy(dtype=np.float32, copy=False), # float32 halves the payload sent to Plotly
+                x=pivot_df.columns.to_numpy(),
+                y=pivot_df.index.to_numpy(),
                 colorscale='RdBu',
                 zmid=0,
                 hoverongaps=False
             ))
             
             fig.update_layout(
-                title='Average Sentiment by Language Over Time',
-                xaxis_title='Date',
+                title='Average Sentiment by Language Over Time' + (' (Weekly)' if heatmap_freq == 'W' else ''),
+                xaxis_title='Week' if heatmap_freq == 'W' else 'Date',
                 yaxis_title='Language',
                 height=400,
                 paper_bgcolor=theme['background'],
@@ -418,49 +551,8 @@ def render_product_feedback(filters, debug_mode=False):
     # Recent Reviews Section
     with st.expander("Recent Reviews", expanded=True):
         st.subheader("Recent Reviews (Translated)")
-        col1, col2, col3 = st.columns(3)
+        render_recent_reviews(recent_reviews_data)
     
-    with col1:
-        rating_range = st.slider("Rating Range", 1, 5, (1, 5))
-    
-    with col2:
-        sentiment_filter = st.selectbox("Sentiment Filter", 
-                                      ["All", "Positive", "Neutral", "Negative"])
-    
-    with col3:
-        available_languages = ["All"]
-        if not recent_reviews_data.empty and 'review_language' in recent_reviews_data.columns:
-            available_languages.extend(sorted(recent_reviews_data['review_language'].unique().tolist()))
-        selected_language = st.selectbox("Filter by Language", available_languages, key="language_filter")
-
-    # Filter reviews
-    filtered_reviews = recent_reviews_data.copy()
-    min_selected_rating, max_selected_rating = rating_range
-    filtered_reviews = filtered_reviews[filtered_reviews['review_rating'].between(min_selected_rating, max_selected_rating)]
-    
-    if selected_language != "All":
-        filtered_reviews = filtered_reviews[filtered_reviews['review_language'] == selected_language]
-
-    if sentiment_filter != "All":
-        if sentiment_filter == "Positive":
-            filtered_reviews = filtered_reviews[filtered_reviews['sentiment_score'] > 0.2]
-        elif sentiment_filter == "Neutral":
-            filtered_reviews = filtered_reviews['sentiment_score'].between(-0.2, 0.2)
-        else:
-            filtered_reviews = filtered_reviews[filtered_reviews['sentiment_score'] < -0.2]
-    
-    # Display reviews
-    for _, review in filtered_reviews.iterrows():
-        with st.expander(f"Review {review['review_id']} - Rating: {review['review_rating']} ⭐"):
-            st.write(f"**Date:** {review['review_date'].strftime('%Y-%m-%d')}")
-            st.write(f"**Language:** {review['review_language']}")
-            st.write(f"**Sentiment Score:** {review['sentiment_score']:.2f}")
-            st.write("**Original Text:**")
-            st.write(review['review_text'])
-            if review['review_language'] != 'en':
-                st.write("**English Translation:**")
-                st.write(review['review_text_english'])
-                
     # Add download buttons for data
     with st.expander("Download Datasets", expanded=True):
         st.subheader("Download Data")
@@ -468,14 +560,14 @@ def render_product_feedback(filters, debug_mode=False):
         with col1:
             st.download_button(
                 label="⇓ Download Rating Trend Data",
-                data=rating_trend_data.to_csv(index=False),
+                data=df_to_csv_bytes(rating_trend_data),
                 file_name="rating_trend.csv",
                 mime="text/csv",
                 help="Download the rating trend data as CSV"
             )
             st.download_button(
                 label="⇓ Download Rating Distribution Data",
-                data=rating_dist_data.to_csv(index=False),
+                data=df_to_csv_bytes(rating_dist_data),
                 file_name="rating_distribution.csv",
                 mime="text/csv",
                 help="Download the rating distribution data as CSV"
@@ -483,14 +575,15 @@ def render_product_feedback(filters, debug_mode=False):
         with col2:
             st.download_button(
                 label="⇓ Download Language Sentiment Data",
-                data=sentiment_lang_data.to_csv(index=False),
+                data=df_to_csv_bytes(sentiment_lang_data),
                 file_name="sentiment_by_language.csv",
                 mime="text/csv",
                 help="Download the sentiment by language data as CSV"
             )
             st.download_button(
                 label="⇓ Download Recent Reviews Data",
-                data=recent_reviews_data.to_csv(index=False),
+                # sentiment_bucket is only a filter helper added in load_sql, not query output
+                data=df_to_csv_bytes(recent_reviews_data.drop(columns='sentiment_bucket', errors='ignore')),
                 file_name="recent_reviews.csv",
                 mime="text/csv",
                 help="Download the recent reviews data as CSV"
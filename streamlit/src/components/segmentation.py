@@ -6,22 +6,101 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from utils.database import snowflake_conn
+import numpy as np
+from typing import Any, Dict
+from utils.database import snowflake_conn, run_concurrently
 from utils.debug import display_debug_info
 from utils.theme import get_current_theme
 from utils.kpi_cards import render_kpis, render_simple_kpis
+from utils.export import df_to_csv_bytes
 import os
 
+# Static styles for the tab; kept at module level so the string is built once
+# per process. Streamlit drops elements that are not re-emitted on a rerun, so
+# the block is still sent with each render rather than gated on session state.
+_SEGMENTATION_CSS = """
+<style>
+h2 {
+    padding: 0 !important;
+    margin: 0 !important;
+}
+/* Ensure tooltip styling is available if not globally defined */
+.tooltip {
+  position: relative;
+  display: inline-block;
+}
+.tooltip .tooltiptext {
+  visibility: hidden;
+  width: 220px;
+  background-color: #555;
+  color: #fff;
+  text-align: center;
+  border-radius: 6px;
+  padding: 5px 0;
+  position: absolute;
+  z-index: 1;
+  bottom: 125%; /* Position the tooltip above the text */
+  left: 50%;
+  margin-left: -110px; /* Use half of the width (220/2 = 110) to center the tooltip */
+  opacity: 0;
+  transition: opacity 0.3s;
+}
+.tooltip .tooltiptext::after {
+  content: "";
+  position: absolute;
+  top: 100%; /* At the bottom of the tooltip */
+  left: 50%;
+  margin-left: -5px;
+  border-width: 5px;
+  border-style: solid;
+  border-color: #555 transparent transparent transparent;
+}
+.tooltip:hover .tooltiptext {
+  visibility: visible;
+  opacity: 1;
+}
+.help-icon {
+  display: inline-block;
+  width: 16px;
+  height: 16px;
+  background-color: #ccc;
+  color: white;
+  border-radius: 50%;
+  text-align: center;
+  font-size: 12px;
+  line-height: 16px;
+  cursor: help;
+}
+</style>
+"""
+
+# Churn and upsell scores are the integers 0-3 (see chart_data_bundle.sql),
+# so the density grid has one cell per score pair
+SCORE_LEVELS = 4
+
+def _tooltip_header(title: str, tip: str) -> str:
+    """Return the HTML for a section heading with a hover tooltip."""
+    return f'''
+    <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+        <h3 style="margin: 0; font-size: 1.2rem; font-weight: 600;">{title}</h3>
+        <div class="tooltip">
+            <span class="help-icon">?</span>
+            <span class="tooltiptext">{tip}</span>
+        </div>
+    </div>
+    '''
+
 # --- KPI Data Loading Functions ---
 @st.cache_data(ttl=300)
-def load_combined_kpi_data() -> pd.DataFrame:
-    """Load combined data for all KPIs."""
+def load_combined_kpi_data() -> Dict[str, Any]:
+    """Load combined data for all KPIs.
+    
+    The query returns a single row, so it is returned as a plain dict
+    (empty if there are no results) rather than a one-row DataFrame.
+    """
     query = "segmentation/kpi_combined_segmentation.sql"
     results = snowflake_conn.execute_query(query)
-    df = pd.DataFrame(results)
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(sql_file_path=query, params={}, results=df, query_name="Combined KPI Data")
-    return df
+    return results[0] if results else {}
 
 # Removed old KPI data loading functions:
 # load_dominant_persona_data
@@ -30,89 +109,58 @@ def load_combined_kpi_data() -> pd.DataFrame:
 # load_total_ltv_at_risk_data
 # --- End KPI Data Loading Functions ---
 
-def render_segmentation(filters: dict, debug_mode: bool = False) -> None:
-    """Render the Segmentation & Value dashboard tab.
+# --- Chart Data Loading Functions ---
+# All three charts read CUSTOMER_PERSONA_SIGNALS, so their data comes from one
+# query with shared CTEs, labelled by a TAG column and split here.
+SEGMENTATION_CHART_QUERY = "segmentation/chart_data_bundle.sql"
+
+@st.cache_data(ttl=300)
+def load_chart_data_bundle() -> Dict[str, pd.DataFrame]:
+    """Load the data for all segmentation charts in a single round-trip.
     
-    Args:
-        filters: Dictionary of global filter values.
-        debug_mode: Boolean flag to control visibility of debug information
+    Returns:
+        Dictionary with 'persona_distribution', 'value_segment_metrics' and
+        'churn_vs_upsell' DataFrames, shaped like their former standalone queries
     """
-    st.markdown("""
-    <style>
-    h2 {
-        padding: 0 !important;
-        margin: 0 !important;
-    }
-    /* Ensure tooltip styling is available if not globally defined */
-    .tooltip {
-      position: relative;
-      display: inline-block;
-    }
-    .tooltip .tooltiptext {
-      visibility: hidden;
-      width: 220px;
-      background-color: #555;
-      color: #fff;
-      text-align: center;
-      border-radius: 6px;
-      padding: 5px 0;
-      position: absolute;
-      z-index: 1;
-      bottom: 125%; /* Position the tooltip above the text */
-      left: 50%;
-      margin-left: -110px; /* Use half of the width (220/2 = 110) to center the tooltip */
-      opacity: 0;
-      transition: opacity 0.3s;
-    }
-    .tooltip .tooltiptext::after {
-      content: "";
-      position: absolute;
-      top: 100%; /* At the bottom of the tooltip */
-      left: 50%;
-      margin-left: -5px;
-      border-width: 5px;
-      border-style: solid;
-      border-color: #555 transparent transparent transparent;
-    }
-    .tooltip:hover .tooltiptext {
-      visibility: visible;
-      opacity: 1;
-    }
-    .help-icon {
-      display: inline-block;
-      width: 16px;
-      height: 16px;
-      background-color: #ccc;
-      color: white;
-      border-radius: 50%;
-      text-align: center;
-      font-size: 12px;
-      line-height: 16px;
-      cursor: help;
-    }
-    </style>
-    <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;">
-        <h2>Customer Segmentation & Value</h2>
-        <div class="tooltip">
-            <span class="help-icon">?</span>
-            <span class="tooltiptext">
-                Explore customer segments, their characteristics, value, and migration patterns.
-            </span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Fetched as Arrow and converted in one columnar step rather than from row dicts
+    df = snowflake_conn.execute_query_arrow(SEGMENTATION_CHART_QUERY).to_pandas()
+    slices = dict(tuple(df.groupby('TAG', sort=False))) if 'TAG' in df.columns else {}
+    
+    def _slice(tag: str, dtypes: Dict[str, str]) -> pd.DataFrame:
+        # METRIC_VALUE and the score columns are shared/NULL-padded across the
+        # UNION ALL, so they arrive as float64 or Decimal; restore each slice's types
+        columns = list(dtypes)
+        if tag not in slices:
+            return pd.DataFrame(columns=columns).astype(dtypes)
+        return slices[tag][columns].astype(dtypes).reset_index(drop=True)
     
-    # --- Load KPI Data ---
-    with st.spinner("Loading KPI data..."):
-        combined_kpi_df = load_combined_kpi_data()
+    persona_distribution = _slice('persona_distribution', {'SEGMENT': 'object', 'METRIC_VALUE': 'int64'}).rename(
+        columns={'SEGMENT': 'PERSONA', 'METRIC_VALUE': 'CUSTOMER_COUNT'}
+    ).sort_values('CUSTOMER_COUNT', ascending=False, ignore_index=True)
+    value_segment_metrics = _slice(
+        'value_segment_metrics', {'SEGMENT': 'object', 'METRIC_NAME': 'object', 'METRIC_VALUE': 'float64'}
+    ).sort_values(['SEGMENT', 'METRIC_NAME'], ignore_index=True)
+    churn_vs_upsell = _slice(
+        'churn_vs_upsell', {'CHURN_SCORE': 'int64', 'UPSELL_POTENTIAL': 'int64', 'METRIC_VALUE': 'int64'}
+    ).rename(
+        columns={'METRIC_VALUE': 'CUSTOMER_COUNT'}
+    ).sort_values(['CHURN_SCORE', 'UPSELL_POTENTIAL'], ignore_index=True)
+    
+    return {
+        'persona_distribution': persona_distribution,
+        'value_segment_metrics': value_segment_metrics,
+        'churn_vs_upsell': churn_vs_upsell
+    }
+# --- End Chart Data Loading Functions ---
 
+# --- Section Fragments ---
+@st.fragment
+def render_segmentation_kpis(kpi_data: Dict[str, Any]) -> None:
+    """Render the four segmentation KPI cards from the combined KPI row."""
     # --- Prepare and Render KPIs ---
     kpis_to_render = []
 
-    if not combined_kpi_df.empty:
-        # Extract data from the first (and only) row of the combined DataFrame
-        kpi_data = combined_kpi_df.iloc[0]
-
+    if kpi_data:
         # 1. Dominant Persona
         persona_name = kpi_data.get('DOMINANT_PERSONA_NAME')
         persona_count = kpi_data.get('DOMINANT_PERSONA_COUNT')
@@ -177,7 +225,7 @@ def render_segmentation(filters: dict, debug_mode: bool = False) -> None:
                 "label": "LTV at Risk (High Churn)", "value": "N/A", "delta": 0,
                 "help": "Could not load data for total LTV at risk.", "trend_data": None
             })
-    else: # If combined_kpi_df is empty
+    else: # If the combined KPI query returned no row
         for label, help_text in [
             ("Dominant Persona", "Could not load dominant persona data."),
             ("High-Value Customer %", "Could not load high-value customer percentage."),
@@ -201,166 +249,200 @@ def render_segmentation(filters: dict, debug_mode: bool = False) -> None:
             })
         render_simple_kpis(simple_kpis, columns=4)
     # --- End KPIs ---
-    
-    # --- Visual Inventory from STREAMLIT_PRD.md Section 4.5 ---
-    
+
+@st.fragment
+def render_persona_distribution(persona_dist_chart_data: pd.DataFrame, theme: Dict[str, str], debug_mode: bool = False) -> None:
+    """Render the Persona Distribution chart and its download button."""
     with st.expander("Persona Distribution Analysis", expanded=True):
-        st.markdown('''
-        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-            <h3 style="margin: 0; font-size: 1.2rem; font-weight: 600;">Persona Distribution</h3>
-            <div class="tooltip">
-                <span class="help-icon">?</span>
-                <span class="tooltiptext">
-                    Displays the number of customers belonging to each identified persona. Use this to understand the size of each customer group and identify dominant personas.
-                </span>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-        persona_dist_query = "segmentation/persona_distribution.sql"
-        with st.spinner("Loading persona distribution data..."):
-            persona_dist_chart_data = pd.DataFrame(snowflake_conn.execute_query(persona_dist_query)) # No params
-            
-            if not persona_dist_chart_data.empty and 'PERSONA' in persona_dist_chart_data.columns and 'CUSTOMER_COUNT' in persona_dist_chart_data.columns:
-                theme = get_current_theme()
-                fig_persona_dist = px.bar(
-                    persona_dist_chart_data,
-                    x="PERSONA",
-                    y="CUSTOMER_COUNT",
-                    title="Customer Persona Distribution",
-                    labels={"PERSONA": "Persona", "CUSTOMER_COUNT": "Number of Customers"},
-                    color="PERSONA"
-                )
-                fig_persona_dist.update_layout(
-                    paper_bgcolor=theme['background'],
-                    plot_bgcolor=theme['background'],
-                    font=dict(color=theme['text']),
-                    xaxis=dict(gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
-                    yaxis=dict(gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text']))
-                )
-                st.plotly_chart(fig_persona_dist, use_container_width=True)
-                st.download_button(
-                    label="⇓ Download Persona Distribution Data",
-                    data=persona_dist_chart_data.to_csv(index=False).encode('utf-8'),
-                    file_name="persona_distribution.csv",
-                    mime="text/csv",
-                    help="Download the persona distribution data as CSV"
-                )
-            else:
-                st.info("No persona distribution data available.")
-            if debug_mode:
-                 display_debug_info(
-                    sql_file_path=persona_dist_query, params={}, results=persona_dist_chart_data, query_name="Persona Distribution Chart"
-                )
+        st.markdown(_tooltip_header(
+            "Persona Distribution",
+            "Displays the number of customers belonging to each identified persona. Use this to understand the size of each customer group and identify dominant personas."
+        ), unsafe_allow_html=True)
+        
+        if not persona_dist_chart_data.empty and 'PERSONA' in persona_dist_chart_data.columns and 'CUSTOMER_COUNT' in persona_dist_chart_data.columns:
+            # Built with graph_objects directly; one bar per persona, coloured
+            # with the default qualitative palette as px.bar(color=...) did
+            personas = persona_dist_chart_data['PERSONA'].to_numpy()
+            palette = px.colors.qualitative.Plotly
+            fig_persona_dist = go.Figure(go.Bar(
+                x=personas,
+                y=persona_dist_chart_data['CUSTOMER_COUNT'].to_numpy(),
+                marker_color=[palette[i % len(palette)] for i in range(len(personas))],
+                hovertemplate='Persona=%{x}<br>Number of Customers=%{y}<extra></extra>'
+            ))
+            fig_persona_dist.update_layout(
+                title="Customer Persona Distribution",
+                paper_bgcolor=theme['background'],
+                plot_bgcolor=theme['background'],
+                font=dict(color=theme['text']),
+                xaxis=dict(title="Persona", gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
+                yaxis=dict(title="Number of Customers", gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text']))
+            )
+            st.plotly_chart(fig_persona_dist, use_container_width=True)
+            st.download_button(
+                label="⇓ Download Persona Distribution Data",
+                data=df_to_csv_bytes(persona_dist_chart_data),
+                file_name="persona_distribution.csv",
+                mime="text/csv",
+                help="Download the persona distribution data as CSV"
+            )
+        else:
+            st.info("No persona distribution data available.")
+        if debug_mode:
+             display_debug_info(
+                sql_file_path=SEGMENTATION_CHART_QUERY, params={}, results=persona_dist_chart_data, query_name="Persona Distribution Chart"
+            )
 
+@st.fragment
+def render_value_segment_radar(value_seg_radar_data: pd.DataFrame, theme: Dict[str, str], debug_mode: bool = False) -> None:
+    """Render the Value Segment Radar chart and its download button."""
     with st.expander("Value Segment Radar", expanded=True):
-        st.markdown('''
-        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-            <h3 style="margin: 0; font-size: 1.2rem; font-weight: 600;">Value Segment Radar</h3>
-            <div class="tooltip">
-                <span class="help-icon">?</span>
-                <span class="tooltiptext">
-                    Presents a multi-axis view comparing normalized key performance indicators (e.g., average purchase value, frequency) across different value segments (e.g., High, Medium, Low Value). Shapes leaning towards the outer edge on an axis indicate stronger performance for that metric in a segment.
-                </span>
-            </div>
-        </div>
-        ''', unsafe_allow_html=True)
-        value_segment_metrics_query = "segmentation/value_segment_metrics.sql"
-        with st.spinner("Loading value segment metrics..."):
-            value_seg_radar_data = pd.DataFrame(snowflake_conn.execute_query(value_segment_metrics_query))
+        st.markdown(_tooltip_header(
+            "Value Segment Radar",
+            "Presents a multi-axis view comparing normalized key performance indicators (e.g., average purchase value, frequency) across different value segments (e.g., High, Medium, Low Value). Shapes leaning towards the outer edge on an axis indicate stronger performance for that metric in a segment."
+        ), unsafe_allow_html=True)
 
-            if not value_seg_radar_data.empty and 'SEGMENT' in value_seg_radar_data.columns and \
-               'METRIC_NAME' in value_seg_radar_data.columns and 'METRIC_VALUE' in value_seg_radar_data.columns:
-                
-                theme = get_current_theme()
-                fig_radar = go.Figure()
-                segments = value_seg_radar_data['SEGMENT'].unique()
+        if not value_seg_radar_data.empty and 'SEGMENT' in value_seg_radar_data.columns and \
+           'METRIC_NAME' in value_seg_radar_data.columns and 'METRIC_VALUE' in value_seg_radar_data.columns:
+            
+            fig_radar = go.Figure()
+            r_max = value_seg_radar_data['METRIC_VALUE'].max()
 
-                for segment_val in segments: # Renamed variable to avoid conflict
-                    segment_data_df = value_seg_radar_data[value_seg_radar_data['SEGMENT'] == segment_val] # Renamed variable
-                    fig_radar.add_trace(go.Scatterpolar(
-                        r=segment_data_df['METRIC_VALUE'],
-                        theta=segment_data_df['METRIC_NAME'],
-                        fill='toself',
-                        name=segment_val
-                    ))
-                
-                fig_radar.update_layout(
-                    polar=dict(
-                        radialaxis=dict(visible=True, range=[0, value_seg_radar_data['METRIC_VALUE'].max()]),
-                        bgcolor=theme['background'],
-                        angularaxis=dict(linecolor=theme['border'], gridcolor=theme['border'], tickfont=dict(color=theme['text'])),
-                        radialaxis_gridcolor=theme['border'],
-                        radialaxis_linecolor=theme['border'],
-                        radialaxis_tickfont=dict(color=theme['text'])
-                    ),
-                    showlegend=True,
-                    title="Value Segment Metrics Radar",
-                    paper_bgcolor=theme['background'],
-                    font=dict(color=theme['text']),
-                    legend=dict(font=dict(color=theme['text']))
-                )
-                st.plotly_chart(fig_radar, use_container_width=True)
-                st.download_button(
-                    label="⇓ Download Value Segment Metrics",
-                    data=value_seg_radar_data.to_csv(index=False).encode('utf-8'),
-                    file_name="value_segment_metrics.csv",
-                    mime="text/csv",
-                    help="Download the value segment metrics data as CSV"
-                )
-            else:
-                st.info("No data available for Value Segment Radar.")
-            if debug_mode:
-                display_debug_info(
-                    sql_file_path=value_segment_metrics_query, params={}, results=value_seg_radar_data, query_name="Value Segment Radar"
-                )
-    
+            # One groupby pass instead of a boolean mask scan per segment
+            for segment_val, segment_data_df in value_seg_radar_data.groupby('SEGMENT', sort=False):
+                fig_radar.add_trace(go.Scatterpolar(
+                    r=segment_data_df['METRIC_VALUE'].to_numpy(),
+                    theta=segment_data_df['METRIC_NAME'].to_numpy(),
+                    fill='toself',
+                    name=segment_val
+                ))
+            
+            fig_radar.update_layout(
+                polar=dict(
+                    radialaxis=dict(visible=True, range=[0, r_max]),
+                    bgcolor=theme['background'],
+                    angularaxis=dict(linecolor=theme['border'], gridcolor=theme['border'], tickfont=dict(color=theme['text'])),
+                    radialaxis_gridcolor=theme['border'],
+                    radialaxis_linecolor=theme['border'],
+                    radialaxis_tickfont=dict(color=theme['text'])
+                ),
+                showlegend=True,
+                title="Value Segment Metrics Radar",
+                paper_bgcolor=theme['background'],
+                font=dict(color=theme['text']),
+                legend=dict(font=dict(color=theme['text']))
+            )
+            st.plotly_chart(fig_radar, use_container_width=True)
+            st.download_button(
+                label="⇓ Download Value Segment Metrics",
+                data=df_to_csv_bytes(value_seg_radar_data),
+                file_name="value_segment_metrics.csv",
+                mime="text/csv",
+                help="Download the value segment metrics data as CSV"
+            )
+        else:
+            st.info("No data available for Value Segment Radar.")
+        if debug_mode:
+            display_debug_info(
+                sql_file_path=SEGMENTATION_CHART_QUERY, params={}, results=value_seg_radar_data, query_name="Value Segment Radar"
+            )
+
+@st.fragment
+def render_churn_vs_upsell(churn_upsell_data: pd.DataFrame, theme: Dict[str, str], debug_mode: bool = False) -> None:
+    """Render the Churn vs Upsell Potential density heatmap and its download button."""
     with st.expander("Churn vs Upsell Potential", expanded=True):
-        st.markdown('''
-        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-            <h3 style="margin: 0; font-size: 1.2rem; font-weight: 600;">Churn vs Upsell Potential</h3>
-            <div class="tooltip">
-                <span class="help-icon">?</span>
-                <span class="tooltiptext">
-                    Shows a 2D density plot of customers based on their predicted churn likelihood and upsell potential scores. Darker areas indicate a higher concentration of customers. Helps identify at-risk high-potential customers or safe low-potential ones.
-                </span>
-            </div>
+        st.markdown(_tooltip_header(
+            "Churn vs Upsell Potential",
+            "Shows a 2D density plot of customers based on their predicted churn likelihood and upsell potential scores. Darker areas indicate a higher concentration of customers. Helps identify at-risk high-potential customers or safe low-potential ones."
+        ), unsafe_allow_html=True)
+        
+        if not churn_upsell_data.empty and 'CHURN_SCORE' in churn_upsell_data.columns and \
+           'UPSELL_POTENTIAL' in churn_upsell_data.columns and 'CUSTOMER_COUNT' in churn_upsell_data.columns:
+            # The query already counts customers per (churn, upsell) score pair;
+            # lay the counts out on the SCORE_LEVELS x SCORE_LEVELS grid, rows along y
+            score_levels = np.arange(SCORE_LEVELS)
+            counts = np.zeros((SCORE_LEVELS, SCORE_LEVELS), dtype=np.int64)
+            np.add.at(
+                counts,
+                (churn_upsell_data['UPSELL_POTENTIAL'].to_numpy(dtype=int),
+                 churn_upsell_data['CHURN_SCORE'].to_numpy(dtype=int)),
+                churn_upsell_data['CUSTOMER_COUNT'].to_numpy()
+            )
+            fig_density = go.Figure(go.Heatmap(
+                z=counts,
+                x=score_levels,
+                y=score_levels,
+                coloraxis='coloraxis',
+                hovertemplate='Churn Likelihood Score=%{x}<br>Upsell Potential Score=%{y}<br>count=%{z}<extra></extra>'
+            ))
+            fig_density.update_layout(
+                title="Churn Score vs. Upsell Potential Density",
+                paper_bgcolor=theme['background'],
+                plot_bgcolor=theme['background'],
+                font=dict(color=theme['text']),
+                xaxis=dict(title="Churn Likelihood Score", dtick=1, gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
+                yaxis=dict(title="Upsell Potential Score", dtick=1, gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
+                coloraxis_colorbar=dict(title='count', tickfont=dict(color=theme['text']))
+            )
+            st.plotly_chart(fig_density, use_container_width=True)
+            st.download_button(
+                label="⇓ Download Churn vs Upsell Data",
+                data=df_to_csv_bytes(churn_upsell_data),
+                file_name="churn_upsell_data.csv",
+                mime="text/csv",
+                help="Download the churn vs upsell potential data as CSV"
+            )
+        else:
+            st.info("No data available for Churn vs Upsell Density.")
+        if debug_mode:
+            display_debug_info(
+                sql_file_path=SEGMENTATION_CHART_QUERY, params={}, results=churn_upsell_data, query_name="Churn vs Upsell Density"
+            )
+# --- End Section Fragments ---
+
+def render_segmentation(filters: dict, debug_mode: bool = False) -> None:
+    """Render the Segmentation & Value dashboard tab.
+    
+    Args:
+        filters: Dictionary of global filter values.
+        debug_mode: Boolean flag to control visibility of debug information
+    """
+    st.markdown(_SEGMENTATION_CSS, unsafe_allow_html=True)
+    st.markdown("""
+    <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;">
+        <h2>Customer Segmentation & Value</h2>
+        <div class="tooltip">
+            <span class="help-icon">?</span>
+            <span class="tooltiptext">
+                Explore customer segments, their characteristics, value, and migration patterns.
+            </span>
         </div>
-        ''', unsafe_allow_html=True)
-        engagement_query = "segmentation/churn_vs_upsell.sql"
-        with st.spinner("Loading churn vs upsell data..."):
-            churn_upsell_data = pd.DataFrame(snowflake_conn.execute_query(engagement_query))
-            
-            if not churn_upsell_data.empty and 'CHURN_SCORE' in churn_upsell_data.columns and 'UPSELL_POTENTIAL' in churn_upsell_data.columns:
-                theme = get_current_theme()
-                fig_density = px.density_heatmap(
-                    churn_upsell_data,
-                    x="CHURN_SCORE",
-                    y="UPSELL_POTENTIAL",
-                    title="Churn Score vs. Upsell Potential Density",
-                    labels={"CHURN_SCORE": "Churn Likelihood Score", "UPSELL_POTENTIAL": "Upsell Potential Score"}
-                )
-                fig_density.update_layout(
-                    paper_bgcolor=theme['background'],
-                    plot_bgcolor=theme['background'],
-                    font=dict(color=theme['text']),
-                    xaxis=dict(gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
-                    yaxis=dict(gridcolor=theme['border'], linecolor=theme['border'], tickfont=dict(color=theme['text'])),
-                    coloraxis_colorbar=dict(tickfont=dict(color=theme['text']))
-                )
-                st.plotly_chart(fig_density, use_container_width=True)
-                st.download_button(
-                    label="⇓ Download Churn vs Upsell Data",
-                    data=churn_upsell_data.to_csv(index=False).encode('utf-8'),
-                    file_name="churn_upsell_data.csv",
-                    mime="text/csv",
-                    help="Download the churn vs upsell potential data as CSV"
-                )
-            else:
-                st.info("No data available for Churn vs Upsell Density.")
-            if debug_mode:
-                display_debug_info(
-                    sql_file_path=engagement_query, params={}, results=churn_upsell_data, query_name="Churn vs Upsell Density"
-                )
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # --- Load KPI and Chart Data ---
+    # The KPI and chart queries are independent, so fetch them concurrently
+    with st.spinner("Loading segmentation data..."):
+        results = run_concurrently({
+            'kpis': load_combined_kpi_data,
+            'charts': load_chart_data_bundle
+        })
+        kpi_data = results['kpis']
+        chart_data = results['charts']
+    if debug_mode:
+        display_debug_info(
+            sql_file_path="segmentation/kpi_combined_segmentation.sql", params={}, results=pd.DataFrame([kpi_data]) if kpi_data else pd.DataFrame(), query_name="Combined KPI Data"
+        )
+
+    render_segmentation_kpis(kpi_data)
+    
+    # --- Visual Inventory from STREAMLIT_PRD.md Section 4.5 ---
+    # Each section is a fragment, so interacting with one (e.g. a download
+    # button) reruns only that section instead of the whole tab.
+    theme = get_current_theme()
+    render_persona_distribution(chart_data['persona_distribution'], theme, debug_mode)
+    render_value_segment_radar(chart_data['value_segment_metrics'], theme, debug_mode)
+    render_churn_vs_upsell(chart_data['churn_vs_upsell'], theme, debug_mode)
             
     # Removed Segment Explorer expander block
 
@@ -6,41 +6,489 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from utils.database import snowflake_conn
+from functools import partial
+from utils.database import snowflake_conn, run_concurrently
 from utils.kpi_cards import render_kpis
 from utils.debug import display_debug_info, read_sql_file
 from utils.theme import get_current_theme
-from typing import Dict, Any
+from utils.export import df_to_csv_bytes
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 import json
 from decimal import Decimal
-from scipy.stats import gaussian_kde
+from scipy.ndimage import gaussian_filter1d
 
 def decimal_to_float(obj):
     """Convert Decimal objects to float for JSON serialization."""
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict(orient='records')
-    elif isinstance(obj, pd.Series):
-        return obj.tolist()
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
-def get_smoothed_trend_data(df, column_name, window=30):
+def get_smoothed_trend_data(series, window=30):
     """Get smoothed trend data using a moving average.
     
     Args:
-        df: DataFrame containing the trend data
-        column_name: Name of the column to smooth
+        series: Series of trend values indexed by date
         window: Window size for moving average (default: 30 days)
         
     Returns:
         pd.Series: Smoothed trend data
     """
-    if df is not None and column_name in df.columns:
-        trend_series = df.set_index('date')[column_name]
-        return trend_series.rolling(window=window, min_periods=1).mean()
-    return None
+    if series is None:
+        return None
+    return series.rolling(window=window, min_periods=1).mean()
+
+# SQL files backing this tab, keyed by dataset name
+SENTIMENT_EXPERIENCE_QUERIES = {
+    'sentiment_over_time': "sentiment_experience/sentiment_over_time.sql",
+    'sentiment_distribution': "sentiment_experience/sentiment_distribution.sql",
+    'sentiment_by_persona': "sentiment_experience/sentiment_by_persona.sql",
+    'volatility_vs_trend': "sentiment_experience/volatility_vs_trend.sql",
+    'channel_alignment': "sentiment_experience/channel_alignment.sql",
+    'sentiment_recovery_rate': "sentiment_experience/sentiment_recovery_rate.sql",
+    'kpi_daily_preagg': "sentiment_experience/kpi_daily_preagg.sql"
+}
+
+def rolling_recovery_rate(sentiments, window=2):
+    """Calculate the rolling share of negative sentiments followed by a positive one.
+    
+    Args:
+        sentiments: Sequence of daily average sentiment scores, in date order
+        window: Number of days in each window (default: 2)
+        
+    Returns:
+        np.ndarray: Recovery rate (%) for each day, NaN where the window has no negative days
+    """
+    s = np.asarray(sentiments, dtype=np.float64)
+    rates = np.full(len(s), np.nan)
+    if len(s) < 2 or window < 2:
+        return rates
+    
+    # Day-to-day transitions: each one starts on a negative day and may end on a positive one
+    neg = s[:-1] < 0
+    neg_to_pos = neg & (s[1:] > 0)
+    
+    # A window of `window` days holds `window - 1` transitions; transition k ends on day k + 1
+    total_neg = pd.Series(neg, dtype=np.float64).rolling(window - 1, min_periods=1).sum().to_numpy()
+    recovered = pd.Series(neg_to_pos, dtype=np.float64).rolling(window - 1, min_periods=1).sum().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates[1:] = np.where(total_neg > 0, recovered / total_neg * 100, np.nan)
+    return rates
+
+def weighted_density(scores, weights, x_range):
+    """Estimate a weighted Gaussian kernel density on an evenly spaced grid.
+    
+    The samples are binned onto the grid and the histogram is smoothed with a
+    single Gaussian filter, using the same Scott's-rule bandwidth as
+    scipy.stats.gaussian_kde. Cost is linear in the number of samples rather than
+    samples x grid points.
+    
+    Args:
+        scores: Sample values
+        weights: Weight (count) for each sample
+        x_range: Evenly spaced grid to evaluate the density on
+        
+    Returns:
+        np.ndarray: Density evaluated at each point of x_range
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    step = x_range[1] - x_range[0]
+    if step <= 0 or weights.sum() <= 0:
+        raise ValueError("Density needs a non-degenerate range and positive weights")
+    
+    # Each grid point is the centre of one histogram bin
+    edges = np.append(x_range - step / 2, x_range[-1] + step / 2)
+    hist, _ = np.histogram(scores, bins=edges, weights=weights)
+    density = hist / (weights.sum() * step)
+    
+    # Scott's rule with the effective sample size of the weights
+    mean = np.average(scores, weights=weights)
+    std = np.sqrt(np.average((scores - mean) ** 2, weights=weights))
+    n_eff = weights.sum() ** 2 / (weights ** 2).sum()
+    bandwidth = std * n_eff ** (-1 / 5)
+    if bandwidth <= 0:
+        return density
+    return gaussian_filter1d(density, sigma=bandwidth / step, mode='constant')
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_sentiment_data(sql_path: str) -> pd.DataFrame:
+    """Load the results of a sentiment SQL file as a DataFrame.
+    
+    Cached so reruns triggered by widgets, theme toggles or tab switches
+    reuse the last result instead of going back to Snowflake.
+    
+    Args:
+        sql_path: Path to the SQL file, relative to the sql directory
+        
+    Returns:
+        pd.DataFrame: Query results with lowercase column names and NUMBER columns as float64
+    """
+    df = pd.DataFrame(snowflake_conn.execute_query(sql_path))
+    # Lowercase once per cache miss rather than on every rerun
+    df.rename(columns=str.lower, inplace=True)
+    # Snowflake NUMBER columns arrive as Decimal objects; convert them to floats once
+    # here so downstream groupbys and rolling windows run on native floats
+    for column in df.select_dtypes(include='object').columns:
+        first_valid = df[column].first_valid_index()
+        if first_valid is not None and isinstance(df[column].at[first_valid], Decimal):
+            df[column] = df[column].astype(np.float64)
+    return df
+
+def calculate_delta(trend_data):
+    """Calculate the percentage change between the latest value and the value six points earlier.
+    
+    Args:
+        trend_data: Series containing the trend data
+        
+    Returns:
+        float: Percentage change, or 0.0 when there is not enough data
+    """
+    if trend_data is None or trend_data.shape[0] < 7:
+        return 0.0
+    # iat is the scalar fast path for positional access
+    current = trend_data.iat[-1]
+    previous = trend_data.iat[-7]
+    if previous == 0:
+        return 0.0
+    return float((current - previous) / abs(previous) * 100)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def compute_kpi_data(
+    kpi_daily_df: pd.DataFrame,
+    sentiment_by_persona_df: pd.DataFrame,
+    channel_alignment_df: pd.DataFrame,
+    sentiment_recovery_df: pd.DataFrame
+) -> List[Dict[str, Any]]:
+    """Compute the Key Metrics cards for the Sentiment & Experience tab.
+    
+    Cached on the input frames, so reruns with unchanged data (theme toggles,
+    tab switches, other widgets) skip the groupbys and rolling windows.
+    
+    Args:
+        kpi_daily_df: Daily aggregates from kpi_daily_preagg.sql, in date order
+        sentiment_by_persona_df: Sentiment by persona data
+        channel_alignment_df: Channel alignment data
+        sentiment_recovery_df: Sentiment recovery data
+        
+    Returns:
+        List[Dict[str, Any]]: KPI dictionaries in the format expected by render_kpis
+    
+    Raises:
+        KeyError: If a required column is missing from the data
+    """
+    # Daily aggregates shared by several KPIs, pre-aggregated in Snowflake
+    daily = kpi_daily_df.set_index('date')
+    volatility_by_date = daily['mean_volatility'].astype(float)
+    channel_std_by_date = daily['channel_std'].astype(float)
+    sentiment_by_date = daily['mean_sentiment'].astype(float)
+    
+    # 1. Sentiment Consistency Score (standard deviation of sentiment scores)
+    sentiment_consistency = sentiment_by_persona_df['sentiment_volatility'].mean()
+    sentiment_consistency_trend = get_smoothed_trend_data(volatility_by_date)
+    
+    # 2. Cross-channel Sentiment Alignment (correlation between different channel sentiments)
+    channel_pivot = channel_alignment_df.pivot(index='date', columns='source_type', values='avg_sentiment')
+    channel_correlation = channel_pivot.corr().mean().mean() if channel_pivot.shape[1] > 1 else 0.0
+    channel_alignment_trend = get_smoothed_trend_data(channel_std_by_date)
+    
+    # 3. Customer Experience Score (weighted average of sentiment, rating, and support metrics)
+    daily_experience_score = (
+        sentiment_by_date * 0.4 +
+        (1 - volatility_by_date) * 0.3 +
+        channel_std_by_date * 0.3
+    )
+    experience_score_trend = daily_experience_score.rolling(window=7, min_periods=1).mean()
+    experience_score = daily_experience_score.mean()
+    
+    # 4. Sentiment Recovery Rate (% of negative sentiments followed by positive ones)
+    # sentiment_recovery_rate.sql already returns one row per day in date order
+    sentiments = sentiment_recovery_df['avg_sentiment'].to_numpy()
+    daily_recovery_rates = pd.Series(rolling_recovery_rate(sentiments, window=2), index=sentiment_recovery_df['date'].to_numpy())
+    recovery_trend = daily_recovery_rates.rolling(window=7, min_periods=1).mean()  # Apply 7-day smoothing
+    recovery_rate = np.nanmean(recovery_trend)
+    
+    return [
+        {
+            "label": "Sentiment Consistency",
+            "value": f"{sentiment_consistency:.2f}",
+            "help": "Standard deviation of sentiment scores across all interactions",
+            "trend_data": sentiment_consistency_trend,
+            "delta": calculate_delta(sentiment_consistency_trend)
+        },
+        {
+            "label": "Channel Alignment",
+            "value": f"{channel_correlation:.2f}",
+            "help": "Correlation between sentiment scores across different channels",
+            "trend_data": channel_alignment_trend,
+            "delta": calculate_delta(channel_alignment_trend)
+        },
+        {
+            "label": "Experience Score",
+            "value": f"{experience_score:.2f}",
+            "help": "Weighted average of sentiment, support metrics, and channel alignment",
+            "trend_data": experience_score_trend,
+            "delta": calculate_delta(experience_score_trend)
+        },
+        {
+            "label": "Recovery Rate",
+            "value": f"{recovery_rate:.1f}%",
+            "help": "Percentage of negative sentiments followed by positive ones",
+            "trend_data": recovery_trend,
+            "delta": calculate_delta(recovery_trend)
+        }
+    ]
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_sentiment_trend_figure(sentiment_time_df: pd.DataFrame, theme: Dict[str, str]) -> Dict[str, Any]:
+    """Build the sentiment over time line chart.
+    
+    Cached on the data and theme like the other figure builders, so reruns with
+    unchanged inputs skip Plotly figure construction and validation.
+    
+    Args:
+        sentiment_time_df: Sentiment over time data
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Dict[str, Any]: The figure as a dict, which st.plotly_chart accepts directly
+    """
+    # Plotted as float32 to shrink the figure payload; the frame itself stays
+    # float64 for the CSV download
+    fig = px.line(
+        sentiment_time_df.astype({'rolling_30d_avg': np.float32}),
+        x='date',
+        y='rolling_30d_avg',
+        color='source_type',
+        labels={
+            'date': 'Date',
+            'rolling_30d_avg': 'Average Sentiment',
+            'source_type': 'Source Type'
+        }
+    )
+    
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text']),
+        margin=dict(t=0, l=0, r=0, b=0),
+        height=400,
+        xaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        yaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        )
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_sentiment_distribution_figure(
+    sentiment_dist_df: pd.DataFrame,
+    theme: Dict[str, str]
+) -> Tuple[Optional[Dict[str, Any]], List[Tuple[str, str]]]:
+    """Build the stacked per-source sentiment density chart.
+    
+    Args:
+        sentiment_dist_df: Sentiment distribution data with source_type, sentiment_score and count
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Tuple of the figure as a dict (None when no source has enough data) and a
+        list of (source, error message) pairs for sources whose density failed
+    """
+    # Create a color palette that's intuitive for sentiment
+    colors = ['#d62728', '#ff7f0e', '#bcbd22', '#2ca02c', '#1f77b4']
+    
+    # Calculate common x range for all sources
+    scores = sentiment_dist_df['sentiment_score'].to_numpy(dtype=np.float64)
+    x_min, x_max = np.nanmin(scores), np.nanmax(scores)
+    x_range = np.linspace(x_min, x_max, 100)
+    # The densities are computed in float64 but sent to the browser as float32
+    # (rounded to 4 decimals), which roughly halves the figure's array payload
+    x_plot = x_range.astype(np.float32)
+    
+    # All density traces share one hover template
+    hovertemplate = (
+        "<b>Source:</b> %{fullData.name}<br>" +
+        "<b>Sentiment Score:</b> %{x:.2f}<br>" +
+        "<b>Density:</b> %{y:.2f}<extra></extra>"
+    )
+    
+    # Build a density trace for each source type; they are collected and handed to
+    # the Figure constructor in one batch so Plotly validates the trace list once
+    traces = []
+    valid_sources = []
+    failed_sources = []
+    # A single groupby partitions the frame once; sort=False keeps first-appearance order
+    for idx, (source, source_data) in enumerate(sentiment_dist_df.groupby('source_type', sort=False)):
+        # Skip if we don't have enough data points
+        if len(source_data) < 2:
+            continue
+            
+        valid_sources.append(source)
+        
+        try:
+            # Calculate kernel density estimate
+            y_range = weighted_density(source_data['sentiment_score'], source_data['count'], x_range)
+            
+            # Normalize the density for better visualization
+            max_density = y_range.max()
+            if max_density > 0:  # Only normalize if we have non-zero values
+                y_range = y_range / max_density
+            
+            # Add the density plot with increased spacing
+            y_plot = np.round(y_range + (len(valid_sources) - 1) * 1.2, 4).astype(np.float32)  # Use valid_sources count for spacing
+            traces.append(go.Scatter(
+                x=x_plot,
+                y=y_plot,
+                fill='tonexty',
+                name=source,
+                line=dict(width=1),
+                fillcolor=colors[idx % len(colors)],
+                opacity=0.7,
+                showlegend=True,
+                hovertemplate=hovertemplate
+            ))
+        except Exception as e:
+            failed_sources.append((source, str(e)))
+            continue
+    
+    if not valid_sources:
+        return None, failed_sources
+    
+    # Create the figure with its traces and full layout in one step
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title='Sentiment Distribution by Source',
+            height=400,
+            paper_bgcolor=theme['background'],
+            plot_bgcolor=theme['background'],
+            font=dict(color=theme['text']),
+            margin=dict(t=40, l=0, r=0, b=0),
+            xaxis=dict(
+                title='Sentiment Score',
+                gridcolor=theme['border'],
+                linecolor=theme['border'],
+                tickfont=dict(color=theme['text']),
+                range=[x_min, x_max]  # Set fixed x-axis range
+            ),
+            yaxis=dict(
+                title='Source',
+                gridcolor=theme['border'],
+                linecolor=theme['border'],
+                tickfont=dict(color=theme['text']),
+                showticklabels=False,  # Hide y-axis labels since we're using the legend
+                range=[-0.2, len(valid_sources) * 1.2]  # Use valid_sources count for range
+            ),
+            legend=dict(
+                yanchor="top",
+                y=0.99,
+                xanchor="left",
+                x=1.05,
+                bgcolor=theme['background'],
+                bordercolor=theme['border'],
+                borderwidth=1
+            ),
+            # Reference line at 0
+            shapes=[
+                dict(
+                    type="line",
+                    x0=0,
+                    x1=0,
+                    y0=-0.2,
+                    y1=len(valid_sources) * 1.2,
+                    line=dict(
+                        color=theme['text'],
+                        width=1,
+                        dash="dash",
+                    ),
+                    opacity=0.5
+                )
+            ]
+        )
+    )
+    
+    return fig.to_dict(), failed_sources
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_volatility_figure(sentiment_by_persona_df: pd.DataFrame, theme: Dict[str, str]) -> Dict[str, Any]:
+    """Build the sentiment volatility vs trend scatter, sized by average sentiment.
+    
+    Args:
+        sentiment_by_persona_df: Sentiment by persona data
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Dict[str, Any]: The figure as a dict, which st.plotly_chart accepts directly
+    """
+    avg_sentiment = sentiment_by_persona_df['avg_sentiment']
+    s_min = avg_sentiment.min()
+    s_max = avg_sentiment.max()
+
+    size_min_display = 5  # Min marker size in pixels
+    size_max_display = 30 # Max marker size in pixels
+
+    # Marker sizes are computed as a standalone Series instead of a column on a copy of the frame
+    if pd.isna(s_min) or pd.isna(s_max) or s_max == s_min:
+        marker_size = pd.Series((size_min_display + size_max_display) / 2, index=sentiment_by_persona_df.index)
+    else:
+        normalized_sentiment = (avg_sentiment - s_min) / (s_max - s_min)
+        marker_size = size_min_display + normalized_sentiment * (size_max_display - size_min_display)
+    
+    marker_size = marker_size.fillna(size_min_display)
+
+    fig = px.scatter(
+        sentiment_by_persona_df,
+        x='sentiment_volatility',
+        y='sentiment_trend',
+        color='persona',
+        size=marker_size.to_numpy(dtype=np.float32),
+        title='Sentiment Volatility vs Trend by Persona',
+        labels={
+            'sentiment_volatility': 'Sentiment Volatility',
+            'sentiment_trend': 'Sentiment Trend',
+            'persona': 'Persona'
+        },
+        hover_name='persona',
+        # Rounded once here (in float64, so the values serialize as short decimals)
+        # rather than formatted per point by Plotly.js on every hover
+        custom_data=[avg_sentiment.astype(np.float64).round(2).to_numpy()]
+    )
+    # px can only hide hover fields that are frame columns, so the marker size
+    # array is kept out of the tooltip with one fixed template for all traces
+    fig.update_traces(
+        hovertemplate="<b>%{hovertext}</b><br><br>" +
+                    "Sentiment Volatility=%{x:.2f}<br>" +
+                    "Sentiment Trend=%{y:.2f}<br>" +
+                    "Average Sentiment=%{customdata[0]}<extra></extra>"
+    )
+
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text']),
+        margin=dict(t=40, l=0, r=0, b=0), # Adjusted top margin for title
+        height=400,
+        xaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        yaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        )
+    )
+    
+    return fig.to_dict()
 
 def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = False) -> None:
     """Render the Sentiment & Experience dashboard.
@@ -70,44 +518,43 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
     </div>
     """, unsafe_allow_html=True)
 
-    # Load all data first
+    # Load all data first; the queries are independent, so fetch them concurrently
     with st.spinner("Loading sentiment data..."):
-        sentiment_time_query = "sentiment_experience/sentiment_over_time.sql"
-        sentiment_time_df = pd.DataFrame(snowflake_conn.execute_query(sentiment_time_query))
-        
-        sentiment_dist_query = "sentiment_experience/sentiment_distribution.sql"
-        sentiment_dist_df = pd.DataFrame(snowflake_conn.execute_query(sentiment_dist_query))
-        
-        sentiment_by_persona_query = "sentiment_experience/sentiment_by_persona.sql"
-        sentiment_by_persona_df = pd.DataFrame(snowflake_conn.execute_query(sentiment_by_persona_query))
-        
-        volatility_trend_query = "sentiment_experience/volatility_vs_trend.sql"
-        volatility_trend_df = pd.DataFrame(snowflake_conn.execute_query(volatility_trend_query))
-        
-        channel_alignment_query = "sentiment_experience/channel_alignment.sql"
-        channel_alignment_df = pd.DataFrame(snowflake_conn.execute_query(channel_alignment_query))
-        
-        sentiment_recovery_query = "sentiment_experience/sentiment_recovery_rate.sql"
-        sentiment_recovery_df = pd.DataFrame(snowflake_conn.execute_query(sentiment_recovery_query))
+        results = run_concurrently({
+            name: partial(load_sentiment_data, path) for name, path in SENTIMENT_EXPERIENCE_QUERIES.items()
+        })
+        sentiment_time_df = results['sentiment_over_time']
+        sentiment_dist_df = results['sentiment_distribution']
+        sentiment_by_persona_df = results['sentiment_by_persona']
+        volatility_trend_df = results['volatility_vs_trend']
+        channel_alignment_df = results['channel_alignment']
+        sentiment_recovery_df = results['sentiment_recovery_rate']
+        kpi_daily_df = results['kpi_daily_preagg']
     
-    # Display debug information for filters and all queries if debug mode is enabled
-    if st.session_state.get('debug_mode', False):
+    # The parameter and the sidebar's session flag both enable debug output; resolve
+    # them once so every debug section below agrees
+    debug_mode = debug_mode or st.session_state.get('debug_mode', False)
+    
+    # Display debug information for all queries if debug mode is enabled
+    if debug_mode:
         st.markdown("### Debug Information")
         
         # Show debug info for each query
         queries = [
-            ("Sentiment Over Time Query", sentiment_time_query, {}, sentiment_time_df),
-            ("Sentiment Distribution Query", sentiment_dist_query, {}, sentiment_dist_df),
-            ("Sentiment by Persona Query", sentiment_by_persona_query, {}, sentiment_by_persona_df),
-            ("Volatility vs Trend Query", volatility_trend_query, {}, volatility_trend_df),
-            ("Channel Alignment Query", channel_alignment_query, {}, channel_alignment_df),
-            ("Sentiment Recovery Query", sentiment_recovery_query, {}, sentiment_recovery_df)
+            ("Sentiment Over Time Query", SENTIMENT_EXPERIENCE_QUERIES['sentiment_over_time'], sentiment_time_df),
+            ("Sentiment Distribution Query", SENTIMENT_EXPERIENCE_QUERIES['sentiment_distribution'], sentiment_dist_df),
+            ("Sentiment by Persona Query", SENTIMENT_EXPERIENCE_QUERIES['sentiment_by_persona'], sentiment_by_persona_df),
+            ("Volatility vs Trend Query", SENTIMENT_EXPERIENCE_QUERIES['volatility_vs_trend'], volatility_trend_df),
+            ("Channel Alignment Query", SENTIMENT_EXPERIENCE_QUERIES['channel_alignment'], channel_alignment_df),
+            ("Sentiment Recovery Query", SENTIMENT_EXPERIENCE_QUERIES['sentiment_recovery_rate'], sentiment_recovery_df),
+            ("Daily KPI Aggregates Query", SENTIMENT_EXPERIENCE_QUERIES['kpi_daily_preagg'], kpi_daily_df)
         ]
         
-        for query_name, sql_file, params, results in queries:
+        for query_name, sql_file, results in queries:
+            # None of the sentiment queries take parameters
             display_debug_info(
                 sql_file_path=sql_file,
-                params=params,
+                params={},
                 results=results,
                 query_name=query_name
             )
@@ -116,102 +563,19 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
         st.warning("No sentiment data available.")
         return
     
-    # Convert column names to lowercase
-    sentiment_time_df.columns = sentiment_time_df.columns.str.lower()
-    sentiment_dist_df.columns = sentiment_dist_df.columns.str.lower()
-    sentiment_by_persona_df.columns = sentiment_by_persona_df.columns.str.lower()
-    volatility_trend_df.columns = volatility_trend_df.columns.str.lower()
-    channel_alignment_df.columns = channel_alignment_df.columns.str.lower()
-    sentiment_recovery_df.columns = sentiment_recovery_df.columns.str.lower()
-    
     if debug_mode:
         st.write("Sentiment Time DF Columns:", sentiment_time_df.columns.tolist())
         st.write("Sentiment Time DF Sample:", sentiment_time_df.head())
     
     # Key Metrics Section
     try:
-        # 1. Sentiment Consistency Score (standard deviation of sentiment scores)
-        sentiment_consistency = sentiment_by_persona_df['sentiment_volatility'].mean()
-        sentiment_consistency_trend = get_smoothed_trend_data(
-            sentiment_by_persona_df.groupby('date')['sentiment_volatility'].mean().reset_index(),
-            'sentiment_volatility'
-        )
-        
-        # 2. Cross-channel Sentiment Alignment (correlation between different channel sentiments)
-        channel_pivot = channel_alignment_df.pivot(index='date', columns='source_type', values='avg_sentiment')
-        channel_correlation = channel_pivot.corr().mean().mean() if channel_pivot.shape[1] > 1 else 0.0
-        channel_alignment_trend = get_smoothed_trend_data(
-            channel_alignment_df.groupby('date')['avg_sentiment'].std().reset_index(),
-            'avg_sentiment'
+        kpi_data = compute_kpi_data(
+            kpi_daily_df,
+            sentiment_by_persona_df,
+            channel_alignment_df,
+            sentiment_recovery_df
         )
         
-        # 3. Customer Experience Score (weighted average of sentiment, rating, and support metrics)
-        daily_experience_score = (
-            sentiment_time_df.groupby('date')['avg_sentiment'].mean() * 0.4 +
-            (1 - sentiment_by_persona_df.groupby('date')['sentiment_volatility'].mean()) * 0.3 +
-            channel_alignment_df.groupby('date')['avg_sentiment'].std() * 0.3
-        )
-        experience_score_trend = daily_experience_score.rolling(window=7, min_periods=1).mean()
-        experience_score = daily_experience_score.mean()
-        
-        # 4. Sentiment Recovery Rate (% of negative sentiments followed by positive ones)
-        def rolling_recovery_rate(sentiments, window=2):
-            rates = []
-            for i in range(len(sentiments)):
-                start = max(0, i - window + 1)
-                window_sents = sentiments[start:i+1]
-                neg_to_pos = sum(1 for j in range(len(window_sents)-1) if window_sents[j] < 0 and window_sents[j+1] > 0)
-                total_neg = sum(1 for j in range(len(window_sents)-1) if window_sents[j] < 0)
-                rate = (neg_to_pos / total_neg * 100) if total_neg > 0 else np.nan
-                rates.append(rate)
-            return rates
-        sentiment_recovery_df_sorted = sentiment_recovery_df.sort_values('date')
-        sentiments = sentiment_recovery_df_sorted['avg_sentiment'].values
-        daily_recovery_rates = pd.Series(rolling_recovery_rate(sentiments, window=2), index=sentiment_recovery_df_sorted['date'])
-        recovery_trend = daily_recovery_rates.rolling(window=7, min_periods=1).mean()  # Apply 7-day smoothing
-        recovery_rate = np.nanmean(recovery_trend)
-        
-        # Calculate deltas for each KPI using trend data
-        def calculate_delta(trend_data):
-            if trend_data is None or len(trend_data) < 7:
-                return 0.0
-            current = trend_data.iloc[-1]
-            previous = trend_data.iloc[-7]
-            if previous == 0:
-                return 0.0
-            return ((current - previous) / abs(previous)) * 100
-
-        kpi_data = [
-            {
-                "label": "Sentiment Consistency",
-                "value": f"{sentiment_consistency:.2f}",
-                "help": "Standard deviation of sentiment scores across all interactions",
-                "trend_data": sentiment_consistency_trend,
-                "delta": calculate_delta(sentiment_consistency_trend)
-            },
-            {
-                "label": "Channel Alignment",
-                "value": f"{channel_correlation:.2f}",
-                "help": "Correlation between sentiment scores across different channels",
-                "trend_data": channel_alignment_trend,
-                "delta": calculate_delta(channel_alignment_trend)
-            },
-            {
-                "label": "Experience Score",
-                "value": f"{experience_score:.2f}",
-                "help": "Weighted average of sentiment, support metrics, and channel alignment",
-                "trend_data": experience_score_trend,
-                "delta": calculate_delta(experience_score_trend)
-            },
-            {
-                "label": "Recovery Rate",
-                "value": f"{recovery_rate:.1f}%",
-                "help": "Percentage of negative sentiments followed by positive ones",
-                "trend_data": recovery_trend,
-                "delta": calculate_delta(recovery_trend)
-            }
-        ]
-        
         render_kpis(kpi_data, columns=4)
         
         # Add download button for KPI data
@@ -259,42 +623,12 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
             # Get current theme
             theme = get_current_theme()
             
-            fig = px.line(
-                sentiment_time_df,
-                x='date',
-                y='rolling_30d_avg',
-                color='source_type',
-                labels={
-                    'date': 'Date',
-                    'rolling_30d_avg': 'Average Sentiment',
-                    'source_type': 'Source Type'
-                }
-            )
-            
-            fig.update_layout(
-                paper_bgcolor=theme['background'],
-                plot_bgcolor=theme['background'],
-                font=dict(color=theme['text']),
-                margin=dict(t=0, l=0, r=0, b=0),
-                height=400,
-                xaxis=dict(
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text'])
-                ),
-                yaxis=dict(
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text'])
-                )
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_sentiment_trend_figure(sentiment_time_df, theme), use_container_width=True)
             
             # Add download button for trend data
             st.download_button(
                 label="⇓ Download Trend Data",
-                data=sentiment_time_df.to_csv(index=False),
+                data=df_to_csv_bytes(sentiment_time_df),
                 file_name="sentiment_trend.csv",
                 mime="text/csv",
                 help="Download the sentiment trend data as CSV",
@@ -321,119 +655,21 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
             # Get current theme
             theme = get_current_theme()
             
-            # Create figure
-            fig = go.Figure()
+            fig, failed_sources = build_sentiment_distribution_figure(sentiment_dist_df, theme)
+            if debug_mode:
+                for source, error in failed_sources:
+                    st.warning(f"Error calculating density for source {source}: {error}")
             
-            # Get unique source types
-            source_types = sentiment_dist_df['source_type'].unique()
-            
-            # Create a color palette that's intuitive for sentiment
-            colors = ['#d62728', '#ff7f0e', '#bcbd22', '#2ca02c', '#1f77b4']
-            
-            # Calculate common x range for all sources
-            x_min = sentiment_dist_df['sentiment_score'].min()
-            x_max = sentiment_dist_df['sentiment_score'].max()
-            x_range = np.linspace(x_min, x_max, 100)
-            
-            # Add a density plot for each source type
-            valid_sources = []
-            for idx, source in enumerate(source_types):
-                source_data = sentiment_dist_df[sentiment_dist_df['source_type'] == source]
-                
-                # Skip if we don't have enough data points
-                if len(source_data) < 2:
-                    continue
-                    
-                valid_sources.append(source)
-                
-                try:
-                    # Calculate kernel density estimate
-                    kde = gaussian_kde(source_data['sentiment_score'], weights=source_data['count'])
-                    y_range = kde(x_range)
-                    
-                    # Normalize the density for better visualization
-                    max_density = y_range.max()
-                    if max_density > 0:  # Only normalize if we have non-zero values
-                        y_range = y_range / max_density
-                    
-                    # Add the density plot with increased spacing
-                    fig.add_trace(go.Scatter(
-                        x=x_range,
-                        y=y_range + (len(valid_sources) - 1) * 1.2,  # Use valid_sources count for spacing
-                        fill='tonexty',
-                        name=source,
-                        line=dict(width=1),
-                        fillcolor=colors[idx % len(colors)],
-                        opacity=0.7,
-                        showlegend=True,
-                        hovertemplate="<b>Source:</b> %{fullData.name}<br>" +
-                                    "<b>Sentiment Score:</b> %{x:.2f}<br>" +
-                                    "<b>Density:</b> %{y:.2f}<extra></extra>"
-                    ))
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"Error calculating density for source {source}: {str(e)}")
-                    continue
-            
-            if not valid_sources:
+            if fig is None:
                 st.info("No valid sentiment distribution data available for visualization.")
                 return
-                
-            # Add a reference line at 0
-            fig.add_shape(
-                type="line",
-                x0=0,
-                x1=0,
-                y0=-0.2,
-                y1=len(valid_sources) * 1.2,
-                line=dict(
-                    color=theme['text'],
-                    width=1,
-                    dash="dash",
-                ),
-                opacity=0.5
-            )
-            
-            # Update layout
-            fig.update_layout(
-                title='Sentiment Distribution by Source',
-                xaxis_title='Sentiment Score',
-                yaxis_title='Source',
-                height=400,
-                paper_bgcolor=theme['background'],
-                plot_bgcolor=theme['background'],
-                font=dict(color=theme['text']),
-                margin=dict(t=40, l=0, r=0, b=0),
-                xaxis=dict(
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text']),
-                    range=[x_min, x_max]  # Set fixed x-axis range
-                ),
-                yaxis=dict(
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text']),
-                    showticklabels=False,  # Hide y-axis labels since we're using the legend
-                    range=[-0.2, len(valid_sources) * 1.2]  # Use valid_sources count for range
-                ),
-                legend=dict(
-                    yanchor="top",
-                    y=0.99,
-                    xanchor="left",
-                    x=1.05,
-                    bgcolor=theme['background'],
-                    bordercolor=theme['border'],
-                    borderwidth=1
-                )
-            )
             
             st.plotly_chart(fig, use_container_width=True)
             
             # Add download button for distribution data
             st.download_button(
                 label="⇓ Download Distribution Data",
-                data=sentiment_dist_df.to_csv(index=False),
+                data=df_to_csv_bytes(sentiment_dist_df),
                 file_name="sentiment_distribution.csv",
                 mime="text/csv",
                 help="Download the sentiment distribution data as CSV",
@@ -463,63 +699,7 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
             missing_cols = [col for col in required_cols if col not in sentiment_by_persona_df.columns]
 
             if not missing_cols:
-                df_to_plot = sentiment_by_persona_df.copy()
-
-                s_min = df_to_plot['avg_sentiment'].min()
-                s_max = df_to_plot['avg_sentiment'].max()
-
-                size_min_display = 5  # Min marker size in pixels
-                size_max_display = 30 # Max marker size in pixels
-
-                if pd.isna(s_min) or pd.isna(s_max) or s_max == s_min:
-                    df_to_plot['marker_size'] = (size_min_display + size_max_display) / 2
-                else:
-                    normalized_sentiment = (df_to_plot['avg_sentiment'] - s_min) / (s_max - s_min)
-                    df_to_plot['marker_size'] = size_min_display + normalized_sentiment * (size_max_display - size_min_display)
-                
-                df_to_plot['marker_size'] = df_to_plot['marker_size'].fillna(size_min_display)
-
-                fig = px.scatter(
-                    df_to_plot,
-                    x='sentiment_volatility',
-                    y='sentiment_trend',
-                    color='persona',
-                    size='marker_size', 
-                    title='Sentiment Volatility vs Trend by Persona',
-                    labels={
-                        'sentiment_volatility': 'Sentiment Volatility',
-                        'sentiment_trend': 'Sentiment Trend',
-                        'persona': 'Persona',
-                        'marker_size': 'Average Sentiment' 
-                    },
-                    hover_name='persona',
-                    hover_data={
-                        'avg_sentiment': ':.2f',
-                        'sentiment_volatility': ':.2f',
-                        'sentiment_trend': ':.2f',
-                        'marker_size': False 
-                    }
-                )
-            
-                fig.update_layout(
-                    paper_bgcolor=theme['background'],
-                    plot_bgcolor=theme['background'],
-                    font=dict(color=theme['text']),
-                    margin=dict(t=40, l=0, r=0, b=0), # Adjusted top margin for title
-                    height=400,
-                    xaxis=dict(
-                        gridcolor=theme['border'],
-                        linecolor=theme['border'],
-                        tickfont=dict(color=theme['text'])
-                    ),
-                    yaxis=dict(
-                        gridcolor=theme['border'],
-                        linecolor=theme['border'],
-                        tickfont=dict(color=theme['text'])
-                    )
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(build_volatility_figure(sentiment_by_persona_df, theme), use_container_width=True)
             
             else: # Missing required columns
                 st.info(f"Cannot generate Volatility vs Trend plot: Missing required column(s): {', '.join(missing_cols)} in the data from 'sentiment_by_persona.sql'.")
@@ -527,7 +707,7 @@ def render_sentiment_experience(filters: Dict[str, Any], debug_mode: bool = Fals
             # Download button is available if dataframe is not empty, regardless of plot success
             st.download_button(
                 label="⇓ Download Volatility Data",
-                data=sentiment_by_persona_df.to_csv(index=False),
+                data=df_to_csv_bytes(sentiment_by_persona_df),
                 file_name="sentiment_volatility.csv",
                 mime="text/csv",
                 help="Download the sentiment by persona data (used for volatility analysis) as CSV",
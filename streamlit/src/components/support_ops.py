@@ -11,36 +11,53 @@ from utils.database import snowflake_conn
 from utils.kpi_cards import render_kpis
 from utils.debug import display_debug_info
 from utils.theme import get_current_theme
-import os
+from utils.timeseries import move_mean
+from utils.export import df_to_csv_bytes, to_json_bytes
 from datetime import datetime, timedelta
-import json
-from decimal import Decimal
 import numpy as np
+from types import MappingProxyType
+from typing import Any, Dict
 
-def decimal_to_float(obj):
-    """Convert Decimal objects to float for JSON serialization."""
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict(orient='records')
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+# SQL files fetched together by load_support_ops_bundle, keyed by dataset name
+SUPPORT_OPS_QUERIES = {
+    'ticket_volume': "support_ops/ticket_volume_trend.sql",
+    'priority': "support_ops/priority_breakdown.sql",
+    'first_response': "support_ops/first_response_time.sql",
+    'resolution_rate': "support_ops/resolution_rate.sql",
+    'customer_effort': "support_ops/customer_effort.sql",
+    'channel_effectiveness': "support_ops/channel_effectiveness.sql"
+}
 
-def read_sql_file(file_path: str) -> str:
-    """Read and return the contents of a SQL file.
+@st.cache_data(ttl=300)
+def load_support_ops_bundle(start_date, end_date) -> Dict[str, pd.DataFrame]:
+    """Load and cache all dashboard datasets with a single multi-statement request.
+    
+    All six queries take the same date range, so they are sent to Snowflake
+    together and cost one round trip instead of six.
     
     Args:
-        file_path: Path to the SQL file relative to src/sql/
+        start_date: Start of the selected date range
+        end_date: End of the selected date range
         
     Returns:
-        str: Contents of the SQL file
+        Dict[str, pd.DataFrame]: One DataFrame per SUPPORT_OPS_QUERIES key, with lowercase columns
+            and float columns as float32
     """
-    full_path = os.path.join("src", "sql", file_path)
-    with open(full_path, "r") as f:
-        return f.read()
+    result_sets = snowflake_conn.execute_query_batch(
+        tuple(SUPPORT_OPS_QUERIES.values()),
+        {"start_date": start_date, "end_date": end_date}
+    )
+    # The batch already returns DataFrames with lowercase column names. The
+    # metrics are only shown to one decimal place, so float columns are kept
+    # as float32 to halve what the rolling averages and charts read.
+    for df in result_sets:
+        float_columns = df.select_dtypes(include='float64').columns
+        if len(float_columns):
+            df[float_columns] = df[float_columns].astype(np.float32)
+    return dict(zip(SUPPORT_OPS_QUERIES, result_sets))
 
-@st.cache_data(ttl=300)
 def load_ticket_volume_data(filters: dict) -> pd.DataFrame:
-    """Load and cache ticket volume data.
+    """Load ticket volume data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -48,26 +65,10 @@ def load_ticket_volume_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Ticket volume data
     """
-    query = "support_ops/ticket_volume_trend.sql"
-    results = snowflake_conn.execute_query(query, 
-                      {"start_date": filters["start_date"], 
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Ticket Volume Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['ticket_volume']
 
-@st.cache_data(ttl=300)
 def load_priority_data(filters: dict) -> pd.DataFrame:
-    """Load and cache priority data.
+    """Load priority data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -75,22 +76,7 @@ def load_priority_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Priority data
     """
-    query = "support_ops/priority_breakdown.sql"
-    results = snowflake_conn.execute_query(query,
-                      {"start_date": filters["start_date"],
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Priority Breakdown Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['priority']
 
 @st.cache_data(ttl=300)
 def load_category_data(filters: dict) -> pd.DataFrame:
@@ -103,21 +89,10 @@ def load_category_data(filters: dict) -> pd.DataFrame:
         pd.DataFrame: Category data
     """
     query = "support_ops/category_analysis.sql"
-    results = snowflake_conn.execute_query(query,
+    # Column names come back lowercased from the cursor description
+    return snowflake_conn.execute_query_pandas(query,
                       {"start_date": filters["start_date"],
                        "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Category Analysis Query"
-        )
-    
-    return df
 
 @st.cache_data(ttl=300)
 def load_tickets_per_customer_data(filters: dict) -> pd.DataFrame:
@@ -130,25 +105,13 @@ def load_tickets_per_customer_data(filters: dict) -> pd.DataFrame:
         pd.DataFrame: Tickets per customer data
     """
     query = "support_ops/tickets_per_customer.sql"
-    results = snowflake_conn.execute_query(query,
+    # Column names come back lowercased from the cursor description
+    return snowflake_conn.execute_query_pandas(query,
                       {"start_date": filters["start_date"],
                        "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Tickets per Customer Query"
-        )
-    
-    return df
 
-@st.cache_data(ttl=300)
 def load_first_response_data(filters: dict) -> pd.DataFrame:
-    """Load and cache first response time data.
+    """Load first response time data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -156,26 +119,10 @@ def load_first_response_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: First response time data
     """
-    query = "support_ops/first_response_time.sql"
-    results = snowflake_conn.execute_query(query,
-                      {"start_date": filters["start_date"],
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="First Response Time Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['first_response']
 
-@st.cache_data(ttl=300)
 def load_resolution_rate_data(filters: dict) -> pd.DataFrame:
-    """Load and cache resolution rate data.
+    """Load resolution rate data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -183,26 +130,10 @@ def load_resolution_rate_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Resolution rate data
     """
-    query = "support_ops/resolution_rate.sql"
-    results = snowflake_conn.execute_query(query,
-                      {"start_date": filters["start_date"],
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Resolution Rate Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['resolution_rate']
 
-@st.cache_data(ttl=300)
 def load_customer_effort_data(filters: dict) -> pd.DataFrame:
-    """Load and cache customer effort data.
+    """Load customer effort data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -210,26 +141,10 @@ def load_customer_effort_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Customer effort data
     """
-    query = "support_ops/customer_effort.sql"
-    results = snowflake_conn.execute_query(query,
-                      {"start_date": filters["start_date"],
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Customer Effort Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['customer_effort']
 
-@st.cache_data(ttl=300)
 def load_channel_effectiveness_data(filters: dict) -> pd.DataFrame:
-    """Load and cache channel effectiveness data.
+    """Load channel effectiveness data from the cached support ops bundle.
     
     Args:
         filters: Dictionary containing date range and persona filters
@@ -237,75 +152,214 @@ def load_channel_effectiveness_data(filters: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Channel effectiveness data
     """
-    query = "support_ops/channel_effectiveness.sql"
-    results = snowflake_conn.execute_query(query,
-                      {"start_date": filters["start_date"],
-                       "end_date": filters["end_date"]})
-    df = pd.DataFrame(results)
-    df.columns = df.columns.str.lower()
-    
-    if st.session_state.get('debug_mode', False):
-        display_debug_info(
-            sql_file_path=query,
-            params={"start_date": filters["start_date"], "end_date": filters["end_date"]},
-            results=df,
-            query_name="Channel Effectiveness Query"
-        )
-    
-    return df
+    return load_support_ops_bundle(filters["start_date"], filters["end_date"])['channel_effectiveness']
 
-def calculate_delta(trend_series, is_count_metric=False):
-    """Calculate the percentage change between the last two values.
-    
-    Args:
-        trend_series: Series containing the trend data
-        is_count_metric: If True, treat as a count metric (like total tickets)
-                        and calculate absolute change instead of percentage
-    """
-    if trend_series is None or len(trend_series) < 2:
-        return 0
-    
+def _delta_kernel(vals, is_count_metric):
+    """Percentage change for calculate_delta on a float64 array holding at least two values."""
     # For count metrics, we want to compare the last 7 days with the previous 7 days
     if is_count_metric:
         # Get the last 14 days of data
-        last_14_days = trend_series.tail(14)
-        if len(last_14_days) < 14:
-            return 0
+        if vals.shape[0] < 14:
+            return 0.0
             
         # Calculate current week and previous week totals
-        current_week = last_14_days.tail(7).sum()
-        previous_week = last_14_days.head(7).sum()
+        current_week = np.nansum(vals[-7:])
+        previous_week = np.nansum(vals[-14:-7])
         
-        if pd.isna(current_week) or pd.isna(previous_week) or previous_week == 0:
-            return 0
+        if previous_week == 0:
+            return 0.0
             
         # Calculate percentage change
-        return ((current_week - previous_week) / previous_week) * 100
+        return (current_week - previous_week) / previous_week * 100
     else:
         # For other metrics, compare last two values
-        current = trend_series.iloc[-1]
-        previous = trend_series.iloc[-2]
+        current = vals[-1]
+        previous = vals[-2]
         
-        if pd.isna(current) or pd.isna(previous) or previous == 0:
-            return 0
+        if np.isnan(current) or np.isnan(previous) or previous == 0:
+            return 0.0
             
-        return ((current - previous) / abs(previous)) * 100
+        return (current - previous) / abs(previous) * 100
 
-def get_smoothed_trend_data(df, column_name, window=30):
-    """Get smoothed trend data using a moving average.
+def calculate_delta(trend_series, is_count_metric=False):
+    """Calculate the percentage change between the last two values.
     
     Args:
-        df: DataFrame containing the trend data
-        column_name: Name of the column to smooth
+        trend_series: Series containing the trend data
+        is_count_metric: If True, treat as a count metric (like total tickets)
+                        and calculate absolute change instead of percentage
+    """
+    if trend_series is None or len(trend_series) < 2:
+        return 0
+    
+    # The kernel works on the raw float64 buffer; plain slicing avoids building intermediate Series
+    vals = np.ascontiguousarray(trend_series, dtype=np.float64)
+    return float(_delta_kernel(vals, bool(is_count_metric)))
+
+def summarize_metric(df, column_name, window=30):
+    """Get a metric's overall mean and its smoothed trend from one extraction of the column.
+    
+    Args:
+        df: DataFrame containing a 'date' column and the metric column
+        column_name: Name of the metric column
         window: Window size for moving average (default: 30 days)
         
     Returns:
-        pd.Series: Smoothed trend data
+        tuple: (mean of the column, smoothed trend Series indexed by date)
+        
+    Raises:
+        KeyError: If the metric column is missing
     """
-    if df is not None and column_name in df.columns:
-        trend_series = df.set_index('date')[column_name]
-        return trend_series.rolling(window=window, min_periods=1).mean()
-    return None
+    values = df[column_name].to_numpy(dtype=np.float32, na_value=np.nan)
+    mean = np.nanmean(values) if np.any(~np.isnan(values)) else np.nan
+    trend = move_mean(pd.Series(values, index=pd.Index(df['date'].to_numpy(), name='date'), name=column_name), window)
+    return mean, trend
+
+# Priority levels by severity, and the colour used for each in the priority charts.
+# Read-only, so the cached figure builders can't modify them.
+PRIORITY_ORDER = ('Critical', 'High', 'Medium', 'Low')
+PRIORITY_COLOR_MAP = MappingProxyType({
+    'Critical': '#d62728',  # red
+    'High': '#ff7f0e',     # orange
+    'Medium': '#1f77b4',   # blue
+    'Low': '#2ca02c'       # green
+})
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_ticket_volume_figure(ticket_volume_data: pd.DataFrame, theme: Dict[str, str]) -> Dict[str, Any]:
+    """Build the daily ticket volume chart with its 7-day rolling average.
+    
+    Cached on the data and theme, so reruns with unchanged inputs skip Plotly
+    figure construction and validation.
+    
+    Args:
+        ticket_volume_data: Ticket volume data with date, ticket_count and rolling_avg_ticket_count
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Dict[str, Any]: The figure as a dict, which st.plotly_chart accepts directly
+    """
+    fig = go.Figure()
+
+    # Add trace for daily ticket counts (as bars)
+    fig.add_trace(go.Bar(
+        x=ticket_volume_data['date'],
+        y=ticket_volume_data['ticket_count'],
+        name='Daily Tickets',
+        marker_color=theme.get('primaryColor', '#1f77b4') # Use theme color or a default
+    ))
+
+    # Add trace for 7-day rolling average (as a line)
+    fig.add_trace(go.Scatter(
+        x=ticket_volume_data['date'],
+        y=ticket_volume_data['rolling_avg_ticket_count'],
+        mode='lines',
+        name='7-Day Rolling Average',
+        line=dict(color=theme.get('secondaryColor', '#ff7f0e'), width=2) # Use another theme color or default (e.g., orange)
+    ))
+    
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text']),
+        margin=dict(t=20, l=0, r=0, b=0), # Adjusted top margin as chart title is removed
+        height=400,
+        xaxis=dict(
+            title_text='Date',
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        yaxis=dict(
+            title_text='Number of Tickets',
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            bgcolor=theme.get('secondaryBackgroundColor', theme['background']), # Ensure legend bg matches theme
+            font=dict(color=theme['text'])
+        ),
+        barmode='overlay' # Ensure bars and lines overlay nicely if needed, though with one bar trace it's less critical
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_priority_pie_figure(priority_data: pd.DataFrame, theme: Dict[str, str]) -> Dict[str, Any]:
+    """Build the ticket share by priority donut chart.
+    
+    Args:
+        priority_data: Priority breakdown data
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Dict[str, Any]: The figure as a dict, which st.plotly_chart accepts directly
+    """
+    fig = px.pie(
+        priority_data,
+        values='ticket_count',
+        names='priority',
+        labels={'ticket_count': 'Number of Tickets', 'priority': 'Priority Level'},
+        color='priority',
+        color_discrete_map=PRIORITY_COLOR_MAP,
+        category_orders={'priority': list(PRIORITY_ORDER)},  # px.pie calls .copy() on the order, so it needs a list
+        hole=0.5
+    )
+    fig.update_traces(textinfo='percent+label')
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text'])
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def build_priority_category_figure(priority_data: pd.DataFrame, theme: Dict[str, str]) -> Dict[str, Any]:
+    """Build the ticket count by priority bar chart, stacked by category.
+    
+    Args:
+        priority_data: Priority breakdown data
+        theme: Theme dictionary from get_current_theme()
+        
+    Returns:
+        Dict[str, Any]: The figure as a dict, which st.plotly_chart accepts directly
+    """
+    # priority_breakdown.sql already returns one row per priority and category
+    fig = px.bar(
+        priority_data,
+        x='priority',
+        y='ticket_count',
+        labels={'ticket_count': 'Number of Tickets', 'priority': 'Priority Level', 'category': 'Category'},
+        color='category', # Stack by category
+        text_auto=True,
+        category_orders={'priority': list(PRIORITY_ORDER)} # Ensure x-axis order
+    )
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        font=dict(color=theme['text']),
+        xaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        yaxis=dict(
+            gridcolor=theme['border'],
+            linecolor=theme['border'],
+            tickfont=dict(color=theme['text'])
+        ),
+        barmode='stack', # Ensure bars are stacked
+        showlegend=True # Show legend for categories
+    )
+    
+    return fig.to_dict()
 
 def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> None:
     """Render the Support Operations dashboard.
@@ -335,7 +389,10 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
     </div>
     """, unsafe_allow_html=True)
     
-    # Load all data first
+    # Resolve the theme once; every chart below is built from the same dict
+    theme = get_current_theme()
+    
+    # Load all data first; the first loader fetches the whole bundle, the rest read it from the cache
     with st.spinner("Loading support operations data..."):
         ticket_volume_data = load_ticket_volume_data(filters)
         priority_data = load_priority_data(filters)
@@ -358,27 +415,27 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
         
         # Show debug info for each query
         queries = [
-            ("Ticket Volume Trend Query", "support_ops/ticket_volume_trend.sql", {
+            ("Ticket Volume Trend Query", SUPPORT_OPS_QUERIES['ticket_volume'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, ticket_volume_data),
-            ("Priority Breakdown Query", "support_ops/priority_breakdown.sql", {
+            ("Priority Breakdown Query", SUPPORT_OPS_QUERIES['priority'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, priority_data),
-            ("First Response Time Query", "support_ops/first_response_time.sql", {
+            ("First Response Time Query", SUPPORT_OPS_QUERIES['first_response'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, first_response_data),
-            ("Resolution Rate Query", "support_ops/resolution_rate.sql", {
+            ("Resolution Rate Query", SUPPORT_OPS_QUERIES['resolution_rate'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, resolution_rate_data),
-            ("Customer Effort Query", "support_ops/customer_effort.sql", {
+            ("Customer Effort Query", SUPPORT_OPS_QUERIES['customer_effort'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, customer_effort_data),
-            ("Channel Effectiveness Query", "support_ops/channel_effectiveness.sql", {
+            ("Channel Effectiveness Query", SUPPORT_OPS_QUERIES['channel_effectiveness'], {
                 "start_date": filters["start_date"],
                 "end_date": filters["end_date"]
             }, channel_effectiveness_data)
@@ -399,20 +456,16 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
                       priority_data["ticket_count"].sum() * 100)
         
         # Calculate average first response time in minutes
-        avg_response_time = first_response_data["avg_response_time_minutes"].mean()
-        response_trend = get_smoothed_trend_data(first_response_data, "avg_response_time_minutes")
+        avg_response_time, response_trend = summarize_metric(first_response_data, "avg_response_time_minutes")
         
         # Calculate resolution rate
-        resolution_rate = resolution_rate_data["resolution_rate"].mean()
-        resolution_trend = get_smoothed_trend_data(resolution_rate_data, "resolution_rate")
+        resolution_rate, resolution_trend = summarize_metric(resolution_rate_data, "resolution_rate")
         
         # Calculate customer effort score
-        effort_score = customer_effort_data["customer_effort_score"].mean()
-        effort_trend = get_smoothed_trend_data(customer_effort_data, "customer_effort_score")
+        effort_score, effort_trend = summarize_metric(customer_effort_data, "customer_effort_score")
         
         # Calculate channel effectiveness
-        channel_effectiveness = channel_effectiveness_data["channel_effectiveness_score"].mean()
-        effectiveness_trend = get_smoothed_trend_data(channel_effectiveness_data, "channel_effectiveness_score")
+        channel_effectiveness, effectiveness_trend = summarize_metric(channel_effectiveness_data, "channel_effectiveness_score")
         
         # Convert average response time to hours and minutes for display
         if pd.isna(avg_response_time):
@@ -486,14 +539,14 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
                 "value": kpi["value"],
                 "help": kpi["help"],
                 "delta": kpi["delta"],
-                "trend_data": kpi["trend_data"].tolist() if isinstance(kpi["trend_data"], pd.Series) else None
+                "trend_data": kpi["trend_data"].to_numpy(dtype=np.float64) if isinstance(kpi["trend_data"], pd.Series) else None
             }
             for kpi in kpis
         ]
         
         st.download_button(
             label="⇓ Download KPI Data",
-            data=json.dumps(kpi_data_for_json, indent=2, default=decimal_to_float),
+            data=to_json_bytes(kpi_data_for_json),
             file_name="support_kpi_data.json",
             mime="application/json",
             help="Download the current KPI data as JSON"
@@ -520,67 +573,15 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
         ''', unsafe_allow_html=True)
         
         if not ticket_volume_data.empty:
-            # Get current theme
-            theme = get_current_theme()
-
-            # Calculate 7-day rolling average
-            ticket_volume_data['rolling_avg_ticket_count'] = ticket_volume_data['ticket_count'].rolling(window=7, min_periods=1).mean()
+            # Calculate 7-day rolling average (compiled moving-window kernel when numbagg is available)
+            ticket_volume_data['rolling_avg_ticket_count'] = move_mean(ticket_volume_data['ticket_count'], 7)
             
-            fig = go.Figure()
-
-            # Add trace for daily ticket counts (as bars)
-            fig.add_trace(go.Bar(
-                x=ticket_volume_data['date'],
-                y=ticket_volume_data['ticket_count'],
-                name='Daily Tickets',
-                marker_color=theme.get('primaryColor', '#1f77b4') # Use theme color or a default
-            ))
-
-            # Add trace for 7-day rolling average (as a line)
-            fig.add_trace(go.Scatter(
-                x=ticket_volume_data['date'],
-                y=ticket_volume_data['rolling_avg_ticket_count'],
-                mode='lines',
-                name='7-Day Rolling Average',
-                line=dict(color=theme.get('secondaryColor', '#ff7f0e'), width=2) # Use another theme color or default (e.g., orange)
-            ))
-            
-            fig.update_layout(
-                paper_bgcolor=theme['background'],
-                plot_bgcolor=theme['background'],
-                font=dict(color=theme['text']),
-                margin=dict(t=20, l=0, r=0, b=0), # Adjusted top margin as chart title is removed
-                height=400,
-                xaxis=dict(
-                    title_text='Date',
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text'])
-                ),
-                yaxis=dict(
-                    title_text='Number of Tickets',
-                    gridcolor=theme['border'],
-                    linecolor=theme['border'],
-                    tickfont=dict(color=theme['text'])
-                ),
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1,
-                    bgcolor=theme.get('secondaryBackgroundColor', theme['background']), # Ensure legend bg matches theme
-                    font=dict(color=theme['text'])
-                ),
-                barmode='overlay' # Ensure bars and lines overlay nicely if needed, though with one bar trace it's less critical
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_ticket_volume_figure(ticket_volume_data, theme), use_container_width=True)
             
             # Add download button for trend data
             st.download_button(
                 label="⇓ Download Trend Data",
-                data=ticket_volume_data.to_csv(index=False),
+                data=df_to_csv_bytes(ticket_volume_data),
                 file_name="ticket_volume.csv",
                 mime="text/csv",
                 help="Download the ticket volume data as CSV"
@@ -603,77 +604,17 @@ def render_support_ops_dashboard(filters: dict, debug_mode: bool = False) -> Non
         ''', unsafe_allow_html=True)
         
         if not priority_data.empty:
-            # Sort priorities by severity
-            priority_order = ['Critical', 'High', 'Medium', 'Low']
-            priority_data['priority'] = pd.Categorical(priority_data['priority'], categories=priority_order, ordered=True)
-            priority_data = priority_data.sort_values('priority')
-            # Define color map for priorities
-            color_map = {
-                'Critical': '#d62728',  # red
-                'High': '#ff7f0e',     # orange
-                'Medium': '#1f77b4',   # blue
-                'Low': '#2ca02c'       # green
-            }
+            # priority_breakdown.sql returns the rows in severity order for the
+            # download; the charts also fix that order through category_orders
             col1, col2 = st.columns(2)
             with col1:
-                # Get current theme
-                theme = get_current_theme()
-                fig = px.pie(
-                    priority_data,
-                    values='ticket_count',
-                    names='priority',
-                    labels={'ticket_count': 'Number of Tickets', 'priority': 'Priority Level'},
-                    color='priority',
-                    color_discrete_map=color_map,
-                    hole=0.5
-                )
-                fig.update_traces(textinfo='percent+label')
-                fig.update_layout(
-                    paper_bgcolor=theme['background'],
-                    plot_bgcolor=theme['background'],
-                    font=dict(color=theme['text'])
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(build_priority_pie_figure(priority_data, theme), use_container_width=True)
             with col2:
-                # Get current theme
-                theme = get_current_theme()
-
-                # Aggregate data for stacked bar chart
-                bar_chart_data = priority_data.groupby(
-                    ['priority', 'category'], as_index=False, observed=True
-                )['ticket_count'].sum()
-
-                fig = px.bar(
-                    bar_chart_data,
-                    x='priority',
-                    y='ticket_count',
-                    labels={'ticket_count': 'Number of Tickets', 'priority': 'Priority Level', 'category': 'Category'},
-                    color='category', # Stack by category
-                    text_auto=True,
-                    category_orders={'priority': priority_order} # Ensure x-axis order
-                )
-                fig.update_layout(
-                    paper_bgcolor=theme['background'],
-                    plot_bgcolor=theme['background'],
-                    font=dict(color=theme['text']),
-                    xaxis=dict(
-                        gridcolor=theme['border'],
-                        linecolor=theme['border'],
-                        tickfont=dict(color=theme['text'])
-                    ),
-                    yaxis=dict(
-                        gridcolor=theme['border'],
-                        linecolor=theme['border'],
-                        tickfont=dict(color=theme['text'])
-                    ),
-                    barmode='stack', # Ensure bars are stacked
-                    showlegend=True # Show legend for categories
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(build_priority_category_figure(priority_data, theme), use_container_width=True)
             # Add download button for priority data
             st.download_button(
                 label="⇓ Download Priority Data",
-                data=priority_data.to_csv(index=False),
+                data=df_to_csv_bytes(priority_data),
                 file_name="priority_breakdown.csv",
                 mime="text/csv",
                 help="Download the priority breakdown data as CSV"
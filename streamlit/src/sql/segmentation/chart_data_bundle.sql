@@ -0,0 +1,85 @@
+-- sql/segmentation/chart_data_bundle.sql
+-- Provides data for the Persona Distribution, Value Segment Radar and Churn vs Upsell charts
+-- in a single request. All three read ANALYTICS.CUSTOMER_PERSONA_SIGNALS, so they share one
+-- base CTE and are returned as one result set labelled by TAG:
+--   'persona_distribution'  -> SEGMENT (persona), METRIC_VALUE (customer count)
+--   'value_segment_metrics' -> SEGMENT, METRIC_NAME, METRIC_VALUE
+--   'churn_vs_upsell'       -> CHURN_SCORE, UPSELL_POTENTIAL, METRIC_VALUE (customer count per score pair)
+
+WITH base AS (
+    SELECT
+        CUSTOMER_ID,
+        DERIVED_PERSONA,
+        AVG_SENTIMENT,
+        SENTIMENT_VOLATILITY,
+        AVG_RATING,
+        TICKET_COUNT,
+        CHURN_RISK,
+        UPSELL_OPPORTUNITY
+    FROM ANALYTICS.CUSTOMER_PERSONA_SIGNALS
+),
+persona_base AS (
+    SELECT *
+    FROM base
+    WHERE DERIVED_PERSONA IS NOT NULL AND DERIVED_PERSONA != '' -- Ensure persona is not null or empty
+),
+persona_distribution AS (
+    SELECT
+        DERIVED_PERSONA AS PERSONA,
+        COUNT(DISTINCT CUSTOMER_ID) AS CUSTOMER_COUNT
+    FROM persona_base
+    GROUP BY 1
+),
+radar_chart_metrics AS (
+    SELECT
+        DERIVED_PERSONA AS SEGMENT,
+        AVG(AVG_SENTIMENT) AS AVG_SENTIMENT_SCORE,
+        AVG(SENTIMENT_VOLATILITY) AS AVG_SENTIMENT_VOLATILITY,
+        AVG(AVG_RATING) AS AVG_CUSTOMER_RATING,
+        AVG(TICKET_COUNT) AS AVG_TICKET_COUNT
+    FROM persona_base
+    GROUP BY 1
+),
+value_segment_metrics AS (
+    SELECT SEGMENT, 'Avg Sentiment Score' AS METRIC_NAME, ROUND(AVG_SENTIMENT_SCORE, 2) AS METRIC_VALUE FROM radar_chart_metrics
+    UNION ALL
+    SELECT SEGMENT, 'Avg Sentiment Volatility', ROUND(AVG_SENTIMENT_VOLATILITY, 2) FROM radar_chart_metrics
+    UNION ALL
+    SELECT SEGMENT, 'Avg Customer Rating', ROUND(AVG_CUSTOMER_RATING, 2) FROM radar_chart_metrics
+    UNION ALL
+    SELECT SEGMENT, 'Avg Ticket Count', ROUND(AVG_TICKET_COUNT, 1) FROM radar_chart_metrics
+),
+churn_vs_upsell_scores AS (
+    SELECT
+        CASE LOWER(CHURN_RISK)
+            WHEN 'high' THEN 3
+            WHEN 'medium' THEN 2
+            WHEN 'low' THEN 1
+            ELSE 0 -- Default for unknown values
+        END AS CHURN_SCORE,
+        CASE LOWER(UPSELL_OPPORTUNITY)
+            WHEN 'high' THEN 3
+            WHEN 'medium' THEN 2
+            WHEN 'low' THEN 1
+            ELSE 0 -- Default for unknown values
+        END AS UPSELL_POTENTIAL
+    FROM base
+    WHERE CHURN_RISK IS NOT NULL AND UPSELL_OPPORTUNITY IS NOT NULL
+),
+churn_vs_upsell AS (
+    SELECT
+        CHURN_SCORE,
+        UPSELL_POTENTIAL,
+        COUNT(*) AS CUSTOMER_COUNT
+    FROM churn_vs_upsell_scores
+    GROUP BY 1, 2
+)
+-- Row order is not guaranteed across UNION ALL; the loader sorts each slice.
+SELECT 'persona_distribution' AS TAG, PERSONA AS SEGMENT, NULL AS METRIC_NAME, CUSTOMER_COUNT AS METRIC_VALUE, NULL AS CHURN_SCORE, NULL AS UPSELL_POTENTIAL
+FROM persona_distribution
+UNION ALL
+SELECT 'value_segment_metrics', SEGMENT, METRIC_NAME, METRIC_VALUE, NULL, NULL
+FROM value_segment_metrics
+UNION ALL
+SELECT 'churn_vs_upsell', NULL, NULL, CUSTOMER_COUNT, CHURN_SCORE, UPSELL_POTENTIAL
+FROM churn_vs_upsell;
@@ -0,0 +1,40 @@
+WITH persona_daily AS (
+    SELECT
+        DATE_TRUNC('day', interaction_date) AS date,
+        cb.persona,
+        STDDEV(sentiment_score) AS sentiment_volatility
+    FROM ANALYTICS.FACT_CUSTOMER_INTERACTIONS i
+    LEFT JOIN ANALYTICS.CUSTOMER_BASE cb ON i.customer_id = cb.customer_id
+    GROUP BY 1, 2
+),
+channel_daily AS (
+    SELECT
+        DATE_TRUNC('day', interaction_date) AS date,
+        interaction_type AS source_type,
+        AVG(sentiment_score) AS avg_sentiment
+    FROM ANALYTICS.FACT_CUSTOMER_INTERACTIONS
+    GROUP BY 1, 2
+),
+volatility_by_date AS (
+    SELECT
+        date,
+        AVG(sentiment_volatility) AS mean_volatility
+    FROM persona_daily
+    GROUP BY 1
+),
+channel_by_date AS (
+    SELECT
+        date,
+        AVG(avg_sentiment) AS mean_sentiment,
+        STDDEV(avg_sentiment) AS channel_std
+    FROM channel_daily
+    GROUP BY 1
+)
+SELECT
+    COALESCE(v.date, c.date) AS date,
+    v.mean_volatility,
+    c.mean_sentiment,
+    c.channel_std
+FROM volatility_by_date v
+FULL OUTER JOIN channel_by_date c ON v.date = c.date
+ORDER BY 1;
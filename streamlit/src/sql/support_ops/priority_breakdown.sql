@@ -1,10 +1,17 @@
 SELECT
-    DATE(ticket_date) as date,
     REPLACE(priority_level, '"', '') as priority,
     ticket_category as category,
     COUNT(*) as ticket_count,
-    CAST(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (PARTITION BY DATE(ticket_date)) as FLOAT) as percentage
+    CAST(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () as FLOAT) as percentage
 FROM ANALYTICS.FACT_SUPPORT_TICKETS
 WHERE ticket_date BETWEEN :start_date AND :end_date
-GROUP BY 1, 2, 3
-ORDER BY 1, 4 DESC; 
\ No newline at end of file
+GROUP BY 1, 2
+ORDER BY
+    CASE priority
+        WHEN 'Critical' THEN 1
+        WHEN 'High' THEN 2
+        WHEN 'Medium' THEN 3
+        WHEN 'Low' THEN 4
+        ELSE 5
+    END,
+    3 DESC;
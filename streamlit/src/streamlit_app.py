@@ -14,8 +14,9 @@ st.set_page_config(
 )
 
 # Import required modules first
-from utils.debug import render_global_debug_toggle
+from utils.debug import render_global_debug_toggle, render_load_timings
 from utils.theme import initialize_theme, apply_theme, render_theme_toggle
+from utils.kpi_cards import inject_kpi_css
 from components import registry
 
 def initialize_session_state():
@@ -43,24 +44,53 @@ def initialize_session_state():
     # Validate session state values
     validate_session_state()
 
+@st.cache_data(show_spinner=False)
+def load_asset_base64(path: str) -> str:
+    """Read a static asset once and return it base64-encoded for inline HTML."""
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
 def validate_session_state():
     """Validate session state values and reset to defaults if invalid."""
     # Validate debug settings
     if not isinstance(st.session_state.debug.get('enabled'), bool):
         st.session_state.debug['enabled'] = False
 
+@st.fragment
+def render_active_component(name: str, filters: dict, debug_mode: bool) -> None:
+    """Render the selected dashboard component as a fragment.
+    
+    Interacting with a widget inside the dashboard reruns only this function,
+    not the page header, sidebar and styling around it. Changing the section,
+    theme or debug mode still reruns the whole script.
+    """
+    # Cleared on every run of the fragment so the timings panel shows only this render's loads
+    st.session_state.load_timings = []
+    registry.render_component(name, filters, debug_mode=debug_mode)
+    # Loader latencies and cache hits for the section just rendered (debug mode only)
+    render_load_timings()
+
 # Initialize session state first
 initialize_session_state()
 
 # Apply initial theme after session state is initialized
 apply_theme()
 
+# Inject shared KPI card styles once for all dashboard tabs
+inject_kpi_css()
+
 # Render global debug toggle in sidebar
 render_global_debug_toggle()
 
 # Add theme toggle in sidebar
 render_theme_toggle()
 
+# Query results are cached for five minutes; let users pull fresh data sooner.
+# The click reruns the script, so the tabs below reload from Snowflake.
+with st.sidebar:
+    if st.button("🔄 Refresh Data", help="Clear cached query results and reload them from Snowflake"):
+        st.cache_data.clear()
+
 # Create a more impactful header (title only)
 st.markdown("""
     <style>
@@ -94,22 +124,27 @@ with st.sidebar:
             </a>
         </div>
     """.format(
-        base64.b64encode(open("assets/snowflake-logo.png", "rb").read()).decode(),
-        base64.b64encode(open("assets/dbt-labs-signature_tm_light.svg" if st.session_state.theme['dark_mode'] else "assets/dbt-labs-logo.svg", "rb").read()).decode()
+        load_asset_base64("assets/snowflake-logo.png"),
+        load_asset_base64("assets/dbt-labs-signature_tm_light.svg" if st.session_state.theme['dark_mode'] else "assets/dbt-labs-logo.svg")
     ), unsafe_allow_html=True)
 
-# Create tabs for different dashboard views
-tabs = st.tabs([f"{component.icon} {component.display_name}" 
-                for component in registry.get_all_components()])
-
-# Render each dashboard component in its respective tab
-for tab, component in zip(tabs, registry.get_all_components()):
-    with tab:
-        registry.render_component(
-            component.name,
-            st.session_state.filters,  # Use session state filters
-            debug_mode=st.session_state.debug['enabled']
-        ) 
+# Section selector for the dashboard views. st.tabs would run every tab body
+# (and its queries) on each rerun; only the selected component is rendered here.
+components = registry.get_all_components()
+active_name = st.radio(
+    "Dashboard section",
+    [component.name for component in components],
+    format_func=lambda name: f"{registry.get_component(name).icon} {registry.get_component(name).display_name}",
+    horizontal=True,
+    key="active_tab",
+    label_visibility="collapsed"
+)
+
+render_active_component(
+    active_name,
+    st.session_state.filters,  # Use session state filters
+    debug_mode=st.session_state.debug['enabled']
+)
 
 # Add custom CSS for button text color styles in dark mode
 st.markdown("""
@@ -7,10 +7,11 @@ Utility functions for the Streamlit dashboard.
 from .database import snowflake_conn, run_query 
 
 # From kpi_cards.py - export render_kpis. render_metric_card was not found.
-from .kpi_cards import render_kpis # Removed render_metric_card
+from .kpi_cards import render_kpis, inject_kpi_css # Removed render_metric_card
 
 from .theme import initialize_theme, apply_theme, render_theme_toggle, toggle_theme
-from .debug import display_debug_info, read_sql_file, initialize_debug_mode, render_global_debug_toggle
+from .debug import display_debug_info, read_sql_file, initialize_debug_mode, render_global_debug_toggle, render_load_timings
+from .export import df_to_csv_bytes, to_json_bytes
 #from .auth import get_snowflake_jwt, get_snowflake_api_base_url
 
 __all__ = [
@@ -20,6 +21,7 @@ __all__ = [
     
     # From kpi_cards.py
     'render_kpis', # render_metric_card removed from here as well
+    'inject_kpi_css',
     
     # From theme.py
     'initialize_theme',
@@ -32,6 +34,11 @@ __all__ = [
     'read_sql_file',
     'initialize_debug_mode',
     'render_global_debug_toggle',
+    'render_load_timings',
+    
+    # From export.py
+    'df_to_csv_bytes',
+    'to_json_bytes',
     
     # From auth.py
     # 'get_snowflake_jwt',
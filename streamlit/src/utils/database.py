@@ -3,12 +3,18 @@ Snowflake database connection and query execution utilities.
 Handles connection pooling, query execution, and result caching.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import snowflake.connector
 from snowflake.connector import DictCursor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
+import pyarrow as pa
 
 # Attempt to import Snowpark Session for type checking in SiS environment detection
 try:
@@ -20,6 +26,22 @@ except ImportError:
 
 print(f"DEBUG: SnowparkSession is None after import: {SnowparkSession is None}") # DEBUG PRINT
 
+# Per-thread list of queries sent to Snowflake by the run_concurrently loader
+# running on that thread; None outside a loader
+_load_tracking = threading.local()
+
+def _record_query_sent(query: str) -> None:
+    """Note that the current loader went to Snowflake. Called from the cached execute methods, so only on misses."""
+    queries_sent = getattr(_load_tracking, 'queries_sent', None)
+    if queries_sent is not None:
+        queries_sent.append(query)
+
+@functools.lru_cache(maxsize=64)
+def _load_sql_text(full_path: str) -> str:
+    """Read a SQL file once per process; the files ship with the app and don't change while it runs."""
+    with open(full_path, 'r') as f:
+        return f.read()
+
 class SnowflakeConnection:
     """Manages Snowflake connection and query execution, adapting to SiS or local."""
     
@@ -27,10 +49,13 @@ class SnowflakeConnection:
         """Initialize connection, detecting if running in Streamlit-in-Snowflake or locally."""
         self._snowpark_session = None
         self._local_raw_connection = None
+        self._local_st_connection = None # st.connection wrapper, used to reconnect a closed local session
+        self._reconnect_lock = threading.Lock()
         self._is_sis = False # Assume local unless proven SiS
 
         try:
-            conn_obj = st.connection("snowflake")
+            # Keep-alive stops Snowflake from closing the local session while the app sits idle
+            conn_obj = st.connection("snowflake", client_session_keep_alive=True)
             print(f"DEBUG: conn_obj type: {type(conn_obj)}")
 
             connection_successful = False # Flag to track if any method succeeds
@@ -76,10 +101,12 @@ class SnowflakeConnection:
             if not connection_successful and hasattr(conn_obj, '_instance') and conn_obj._instance is not None and \
                  isinstance(conn_obj._instance, snowflake.connector.SnowflakeConnection):
                 print("DEBUG: Attempting Pattern 4: local raw connection via conn_obj._instance.")
+                self._local_st_connection = conn_obj
                 self._local_raw_connection = conn_obj._instance
                 # self._is_sis remains False (default for local)
                 with self._local_raw_connection.cursor() as cur_test:
                     cur_test.execute("SELECT 1 AS test_col")
+                self._set_query_tag()
                 connection_successful = True # A connection (local) was made
                 print("DEBUG: Success via Pattern 4: local raw connection.")
             
@@ -119,6 +146,25 @@ class SnowflakeConnection:
             # This state should ideally be caught by specific errors above, but as a safeguard:
             raise Exception("Failed to establish Snowflake connection through any available method. Please check logs for specific errors.")
 
+    def _set_query_tag(self) -> None:
+        """Tag the local session's queries. QUERY_TAG is session-wide, so this runs once per connection."""
+        with self._local_raw_connection.cursor() as cur:
+            try: cur.execute("ALTER SESSION SET QUERY_TAG = 'streamlit_app_local'")
+            except Exception: pass # Best effort
+
+    def _local_connection(self) -> snowflake.connector.SnowflakeConnection:
+        """Return the local raw connection, reconnecting first if Snowflake has closed the session."""
+        if not self._local_raw_connection:
+            raise Exception("Local mode, but raw Snowflake connection is not available.")
+        if self._local_raw_connection.is_closed() and self._local_st_connection is not None:
+            with self._reconnect_lock:
+                # Another loader thread may have reconnected while this one waited
+                if self._local_raw_connection.is_closed():
+                    self._local_st_connection.reset()
+                    self._local_raw_connection = self._local_st_connection._instance
+                    self._set_query_tag()
+        return self._local_raw_connection
+
     def _read_sql_file(self, sql_path: str) -> str:
         """Read SQL query from a file.
         
@@ -133,8 +179,7 @@ class SnowflakeConnection:
         project_root = os.path.dirname(utils_dir)
         full_path = os.path.join(project_root, "sql", sql_path)
         try:
-            with open(full_path, 'r') as f:
-                return f.read()
+            return _load_sql_text(full_path)
         except FileNotFoundError:
             st.error(f"SQL file not found at path: {full_path}")
             raise
@@ -168,6 +213,18 @@ class SnowflakeConnection:
                 query = query.replace(f":{key}", formatted_value)
         return query
 
+    def _prepare_query(self, query_or_path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Resolve a SQL file path (or pass through a query string) and substitute params."""
+        final_query: str
+        if query_or_path.endswith('.sql'):
+            final_query = self._read_sql_file(query_or_path)
+        else:
+            final_query = query_or_path
+        
+        # Apply the custom parameter substitution.
+        # WARNING: This is a SQL injection risk and should be replaced with proper parameterized queries.
+        return self._substitute_params(final_query, params)
+
     @st.cache_data(ttl=300)
     def execute_query(
         _self, # _self refers to the instance of SnowflakeConnection
@@ -187,15 +244,8 @@ class SnowflakeConnection:
             Exception: If query execution fails
         """
         
-        final_query: str
-        if query_or_path.endswith('.sql'):
-            final_query = _self._read_sql_file(query_or_path)
-        else:
-            final_query = query_or_path
-        
-        # Apply the custom parameter substitution.
-        # WARNING: This is a SQL injection risk and should be replaced with proper parameterized queries.
-        final_query = _self._substitute_params(final_query, params)
+        final_query = _self._prepare_query(query_or_path, params)
+        _record_query_sent(final_query)
             
         try:
             if _self._is_sis:
@@ -205,14 +255,8 @@ class SnowflakeConnection:
                 snowpark_rows = _self._snowpark_session.sql(final_query).collect()
                 return [row.as_dict() for row in snowpark_rows]
             else: # Local execution
-                if not _self._local_raw_connection:
-                    raise Exception("Local mode, but raw Snowflake connection is not available.")
                 # st.write(f"[Local] Executing: {final_query}")
-                with _self._local_raw_connection.cursor(DictCursor) as cur: # Use positional DictCursor
-                    # Query tag is good practice
-                    try: cur.execute("ALTER SESSION SET QUERY_TAG = 'streamlit_app_local'")
-                    except Exception: pass # Best effort
-                    
+                with _self._local_connection().cursor(DictCursor) as cur: # Use positional DictCursor
                     cur.execute(final_query) # Params are already substituted into final_query
                     results = cur.fetchall()
                     return results
@@ -221,9 +265,203 @@ class SnowflakeConnection:
             st.error(f"Error executing query ({'SiS' if _self._is_sis else 'Local'}): {str(e)}\\nQuery (potentially with substituted params): {final_query}")
             raise
 
+    @st.cache_data(ttl=300)
+    def execute_query_arrow(
+        _self, # _self refers to the instance of SnowflakeConnection
+        query_or_path: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> pa.Table:
+        """Execute a query and return results as a pyarrow Table.
+        
+        Locally this uses the connector's columnar fetch_arrow_all(), which skips
+        building one Python dict per row. In SiS the Snowpark result is fetched
+        with to_pandas() and converted.
+        
+        Args:
+            query_or_path: SQL query string or path to SQL file relative to src/sql/
+            params: Dictionary of parameter values
+            
+        Returns:
+            pyarrow Table containing query results (empty Table if no rows)
+            
+        Raises:
+            Exception: If query execution fails
+        """
+        final_query = _self._prepare_query(query_or_path, params)
+        _record_query_sent(final_query)
+        
+        try:
+            if _self._is_sis:
+                if not _self._snowpark_session:
+                    raise Exception("Streamlit-in-Snowflake mode, but Snowpark session is not available.")
+                return pa.Table.from_pandas(_self._snowpark_session.sql(final_query).to_pandas(), preserve_index=False)
+            else: # Local execution
+                with _self._local_connection().cursor() as cur:
+                    cur.execute(final_query) # Params are already substituted into final_query
+                    table = cur.fetch_arrow_all()
+                    # fetch_arrow_all() returns None when the result set is empty
+                    if table is None:
+                        table = pa.table({col.name: pa.array([], type=pa.null()) for col in cur.description})
+                    return table
+                    
+        except Exception as e:
+            st.error(f"Error executing query ({'SiS' if _self._is_sis else 'Local'}): {str(e)}\\nQuery (potentially with substituted params): {final_query}")
+            raise
+
+    @staticmethod
+    def _fetch_pandas(cur) -> pd.DataFrame:
+        """Fetch the current result of a local cursor as a DataFrame with lowercase column names.
+
+        Uses the connector's Arrow-based fetch_pandas_all(), which builds the
+        DataFrame column by column instead of from one Python dict per row.
+        """
+        columns = [col.name.lower() for col in cur.description]
+        df = cur.fetch_pandas_all()
+        if df.empty and len(df.columns) != len(columns):
+            # Empty results may come back without a schema
+            return pd.DataFrame(columns=columns)
+        df.columns = columns
+        return df
+
+    @st.cache_data(ttl=300)
+    def execute_query_pandas(
+        _self, # _self refers to the instance of SnowflakeConnection
+        query_or_path: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """Execute a query and return results as a DataFrame with lowercase column names.
+
+        Locally this uses the connector's columnar fetch_pandas_all(). In SiS the
+        Snowpark result is fetched with to_pandas().
+
+        Args:
+            query_or_path: SQL query string or path to SQL file relative to src/sql/
+            params: Dictionary of parameter values
+
+        Returns:
+            pandas DataFrame containing query results
+
+        Raises:
+            Exception: If query execution fails
+        """
+        final_query = _self._prepare_query(query_or_path, params)
+        _record_query_sent(final_query)
+
+        try:
+            if _self._is_sis:
+                if not _self._snowpark_session:
+                    raise Exception("Streamlit-in-Snowflake mode, but Snowpark session is not available.")
+                df = _self._snowpark_session.sql(final_query).to_pandas()
+                df.columns = df.columns.str.lower()
+                return df
+            else: # Local execution
+                with _self._local_connection().cursor() as cur:
+                    cur.execute(final_query) # Params are already substituted into final_query
+                    return _self._fetch_pandas(cur)
+
+        except Exception as e:
+            st.error(f"Error executing query ({'SiS' if _self._is_sis else 'Local'}): {str(e)}\\nQuery (potentially with substituted params): {final_query}")
+            raise
+
+    @st.cache_data(ttl=300)
+    def execute_query_batch(
+        _self, # _self refers to the instance of SnowflakeConnection
+        queries_or_paths: tuple,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[pd.DataFrame]:
+        """Execute several queries in one request and return each result set as a DataFrame.
+
+        Locally the statements are sent as a single multi-statement request, so
+        the batch costs one round trip instead of one per query, and each result
+        is fetched with the columnar fetch_pandas_all(). Snowpark's session.sql()
+        only accepts a single statement, so in SiS the queries are run one after
+        another on the session.
+
+        Args:
+            queries_or_paths: SQL query strings or paths to SQL files relative to src/sql/
+            params: Dictionary of parameter values, applied to every query
+
+        Returns:
+            One DataFrame (with lowercase column names) per query, in the order given
+
+        Raises:
+            Exception: If query execution fails
+        """
+        # Each statement loses its trailing semicolon so they can be joined into one request
+        final_queries = [
+            _self._prepare_query(query_or_path, params).strip().rstrip(';')
+            for query_or_path in queries_or_paths
+        ]
+        batch_query = ";\n".join(final_queries)
+        _record_query_sent(batch_query)
+
+        try:
+            if _self._is_sis:
+                if not _self._snowpark_session:
+                    raise Exception("Streamlit-in-Snowflake mode, but Snowpark session is not available.")
+                results = []
+                for final_query in final_queries:
+                    df = _self._snowpark_session.sql(final_query).to_pandas()
+                    df.columns = df.columns.str.lower()
+                    results.append(df)
+                return results
+            else: # Local execution
+                with _self._local_connection().cursor() as cur:
+                    cur.execute(batch_query, num_statements=len(final_queries))
+                    # The cursor starts on the first statement's result; nextset() moves to the next
+                    results = [_self._fetch_pandas(cur)]
+                    while cur.nextset():
+                        results.append(_self._fetch_pandas(cur))
+                    return results
+
+        except Exception as e:
+            st.error(f"Error executing query batch ({'SiS' if _self._is_sis else 'Local'}): {str(e)}\\nQueries (potentially with substituted params): {batch_query}")
+            raise
+
+@st.cache_resource(show_spinner=False)
+def _get_snowflake_connection() -> SnowflakeConnection:
+    """Return the SnowflakeConnection shared by every session.
+    
+    st.cache_resource does not cache exceptions, so a failed connect is
+    retried by the next caller, and concurrent first callers wait for the
+    one connect in flight.
+    """
+    return SnowflakeConnection()
+
+class _BackgroundConnection:
+    """
+    Stand-in for the global SnowflakeConnection that starts connecting on a background thread.
+    
+    Authenticating takes long enough to hold up the first paint, so the
+    connection is requested as soon as this module is imported and the page
+    header and sidebar render meanwhile. Every attribute access (i.e. every
+    query) goes through _get_snowflake_connection, which waits for that
+    connect or, if it failed, tries again and raises that attempt's error.
+    """
+    
+    def __init__(self):
+        # The connection is shared across sessions, so the warm-up thread is
+        # deliberately not bound to the importing session's script run context
+        threading.Thread(target=self._warm_up, name="snowflake-connect", daemon=True).start()
+    
+    @staticmethod
+    def _warm_up() -> None:
+        try:
+            _get_snowflake_connection()
+        except Exception as e:
+            # Not cached; the first query retries and surfaces the error in its session
+            print(f"DEBUG: Background Snowflake connect failed: {str(e)}")
+    
+    def wait_until_connected(self) -> None:
+        """Block until the shared connection is open, retrying a failed setup and re-raising its error."""
+        _get_snowflake_connection()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_snowflake_connection(), name)
+
 # Global instance for other functions to use, initialized when module is imported.
 # This was the original pattern. Consider if `run_query` should take an instance.
-snowflake_conn = SnowflakeConnection()
+snowflake_conn = _BackgroundConnection()
 
 def run_query(query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
@@ -247,4 +485,65 @@ def run_query(query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFra
     #st.write("Query results DataFrame info:")
     #st.write(df.info() if not df.empty else "DataFrame is empty.")
     #st.write("Query results columns:", df.columns.tolist())
-    return df 
\ No newline at end of file
+    return df
+
+def run_concurrently(loaders: Dict[str, Callable[[], Any]], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run independent data loaders on a thread pool and collect their results.
+    
+    Snowflake round-trips are network-bound and the connector releases the GIL
+    while waiting, so overlapping them cuts page load from N round-trips to
+    roughly the slowest one. Loaders keep their own @st.cache_data decorators,
+    so cache hits still return immediately.
+    
+    Args:
+        loaders: Mapping of result name to a zero-argument callable
+        max_workers: Thread pool size (default: one thread per loader)
+        
+    Returns:
+        Dictionary mapping each name to its loader's return value
+    """
+    if not loaders:
+        return {}
+    
+    # Worker threads need the script run context so st.cache_data, st.error and
+    # st.session_state behave the same as on the main script thread.
+    ctx = get_script_run_ctx()
+    
+    # Queries sent by a nested run_concurrently call count towards the outer loader
+    parent_queries_sent = getattr(_load_tracking, 'queries_sent', None)
+    
+    def _call(loader: Callable[[], Any]) -> Tuple[Any, float, bool]:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        _load_tracking.queries_sent = queries_sent = []
+        start = time.perf_counter()
+        try:
+            result = loader()
+        finally:
+            _load_tracking.queries_sent = None
+            if parent_queries_sent is not None:
+                parent_queries_sent.extend(queries_sent)
+        return result, time.perf_counter() - start, bool(queries_sent)
+    
+    # Wait for the connection first so its setup time isn't charged to whichever loader queries first
+    snowflake_conn.wait_until_connected()
+    
+    with ThreadPoolExecutor(max_workers=max_workers or len(loaders)) as executor:
+        futures = {name: executor.submit(_call, loader) for name, loader in loaders.items()}
+        timed = {name: future.result() for name, future in futures.items()}
+    
+    # Kept for the debug load timings panel (utils.debug.render_load_timings). Entries
+    # are appended so nested calls don't replace each other; the app clears the list
+    # before each dashboard render.
+    load_timings = st.session_state.get('load_timings')
+    if load_timings is None:
+        st.session_state.load_timings = load_timings = []
+    load_timings.extend(
+        {
+            "loader": name,
+            "seconds": round(seconds, 3),
+            "source": "Snowflake" if queried else "cache"
+        }
+        for name, (_, seconds, queried) in timed.items()
+    )
+    return {name: result for name, (result, _, _) in timed.items()}
@@ -5,6 +5,7 @@ Debug utility functions for Streamlit dashboard components.
 import streamlit as st
 import pandas as pd
 from typing import Any, Dict, Optional
+import functools
 from pathlib import Path
 
 def display_debug_info(
@@ -41,8 +42,7 @@ def display_debug_info(
     if show_raw_sql:
         st.markdown("#### SQL Query")
         try:
-            with open(Path(__file__).parent.parent / "sql" / sql_file_path) as f:
-                st.code(f.read(), language="sql")
+            st.code(read_sql_file(sql_file_path), language="sql")
         except FileNotFoundError:
             st.error(f"SQL file not found: {sql_file_path}")
     
@@ -73,16 +73,32 @@ def render_global_debug_toggle() -> None:
             help="Toggle debug information display across all dashboard components"
         )
 
+def render_load_timings() -> None:
+    """Render the run_concurrently load timings for the current dashboard in a collapsed expander.
+    
+    Only shown in debug mode. Each loader is listed with its duration and
+    whether it sent a query to Snowflake or was served entirely from the cache.
+    """
+    if not st.session_state.get('debug_mode', False):
+        return
+    timings = st.session_state.get('load_timings')
+    if not timings:
+        return
+    
+    with st.expander("⚙ Load Timings", expanded=False):
+        st.dataframe(pd.DataFrame(timings), hide_index=True, use_container_width=True)
+
+@functools.lru_cache(maxsize=64)
 def read_sql_file(file_path: str) -> str:
     """Read and return the contents of a SQL file.
     
+    Results are cached per path, so each file is read from disk once per process.
+    
     Args:
         file_path: Path to the SQL file relative to src/sql/
         
     Returns:
         str: Contents of the SQL file
     """
-    import os
-    full_path = os.path.join("src", "sql", file_path)
-    with open(full_path, "r") as f:
-        return f.read() 
\ No newline at end of file
+    with open(Path(__file__).parent.parent / "sql" / file_path, "r") as f:
+        return f.read()
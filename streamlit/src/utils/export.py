@@ -0,0 +1,62 @@
+"""
+Helper functions for exporting dashboard data as downloadable files.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import orjson
+except ImportError:
+    orjson = None # orjson not installed, fall back to the standard json module
+
+
+@st.cache_data(ttl=300)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 encoded CSV for st.download_button.
+    
+    Cached so that download buttons don't re-encode the same frame on every
+    widget interaction; the frames passed in come from cached loaders, so
+    reruns hit this cache as well. The output is exactly df.to_csv(index=False).
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        CSV content as bytes
+    """
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values neither serializer handles natively into JSON types."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def to_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON for st.download_button.
+    
+    Uses orjson when available, which writes NumPy arrays and scalars
+    directly; Decimal values are converted to float either way.
+    
+    Args:
+        data: JSON-compatible data, optionally containing NumPy or Decimal values
+        
+    Returns:
+        JSON content as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
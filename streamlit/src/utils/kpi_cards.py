@@ -10,6 +10,321 @@ import matplotlib.pyplot as plt
 import io
 import base64
 
+# Stylesheets for the KPI cards. These are static, so they are emitted once per
+# script run via inject_kpi_css() rather than once per render_kpis call.
+_KPI_CARD_CSS = """
+<style>
+div[data-testid="column"] {
+    background: var(--background-color);
+    border-radius: 1rem;
+    padding: 0 !important;
+    margin: 0 0.5rem;
+}
+div[data-testid="column"]:first-child {
+    margin-left: 0;
+}
+div[data-testid="column"]:last-child {
+    margin-right: 0;
+}
+.kpi-card {
+    background: var(--background-color);
+    padding: 1.5rem;
+    border-radius: 1rem;
+    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+    height: 100%;
+    display: flex;
+    flex-direction: column;
+}
+.kpi-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 6px 25px rgba(0,0,0,0.15);
+}
+.kpi-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+.kpi-label {
+    font-size: 0.875rem;
+    color: var(--text-color-secondary);
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+}
+.kpi-value {
+    font-size: 2rem;
+    font-weight: bold;
+    color: var(--text-color);
+    margin: 0.5rem 0;
+    text-align: center;
+    line-height: 1.2;
+}
+.kpi-badge {
+    background: #3b82f6;
+    color: white;
+    padding: 0.25rem 0.75rem;
+    border-radius: 9999px;
+    font-size: 0.75rem;
+    font-weight: 500;
+    white-space: nowrap;
+}
+.kpi-trend {
+    display: flex;
+    align-items: center;
+    margin-top: auto;
+    font-weight: 600;
+    font-size: 0.875rem;
+    text-align: center;
+    justify-content: center;
+    gap: 0.25rem;
+    padding-top: 0.5rem;
+}
+.kpi-trend.positive {
+    color: #16a34a !important;
+}
+.kpi-trend.negative {
+    color: #dc2626 !important;
+}
+.kpi-trend-text {
+    color: var(--text-color-secondary);
+    font-weight: normal;
+    font-size: 0.875rem;
+}
+.kpi-chart {
+    margin: 1rem 0;
+    text-align: center;
+    min-height: 40px;
+    flex-grow: 1;
+}
+.kpi-chart img {
+    width: 100%;
+    height: auto;
+}
+.help-icon {
+    color: var(--text-color-secondary);
+    cursor: help;
+    font-size: 1rem;
+    width: 1.25rem;
+    height: 1.25rem;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    border-radius: 50%;
+    background: var(--background-color-secondary, #f3f4f6);
+    transition: all 0.2s ease;
+}
+.help-icon:hover {
+    background: var(--background-color-tertiary, #e5e7eb);
+}
+.tooltip {
+    position: relative;
+    display: inline-block;
+}
+.tooltip .tooltiptext {
+    visibility: hidden;
+    width: 300px;
+    background-color: var(--background-color);
+    color: var(--text-color);
+    text-align: left;
+    border-radius: 0.5rem;
+    padding: 0.75rem;
+    position: fixed;
+    z-index: 9999;
+    top: auto;
+    bottom: auto;
+    left: 50%;
+    transform: translateX(-50%);
+    margin-top: 0.5rem;
+    opacity: 0;
+    transition: opacity 0.3s;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+    border: 1px solid var(--border-color, #e5e7eb);
+}
+.tooltip:hover .tooltiptext {
+    visibility: visible;
+    opacity: 1;
+}
+.tooltip .tooltiptext::before {
+    content: "";
+    position: absolute;
+    bottom: 100%;
+    left: 50%;
+    margin-left: -5px;
+    border-width: 5px;
+    border-style: solid;
+    border-color: transparent transparent var(--background-color) transparent;
+}
+@media (max-width: 768px) {
+    div[data-testid="column"] {
+        margin: 0.5rem 0;
+    }
+    .kpi-card {
+        padding: 1rem;
+    }
+    .kpi-value {
+        font-size: 1.5rem;
+    }
+    .kpi-trend {
+        font-size: 0.75rem;
+    }
+    .kpi-trend-text {
+        font-size: 0.75rem;
+    }
+    .tooltip .tooltiptext {
+        width: 250px;
+    }
+}
+</style>
+"""
+
+# Card styles for render_simple_kpis (no trend information).
+_SIMPLE_KPI_CARD_CSS = """
+<style>
+/* General column styling from render_kpis - can be shared or redefined */
+div[data-testid="column"].simple-kpi-column { /* Add a specific class if needed */
+    background: var(--background-color);
+    border-radius: 1rem;
+    padding: 0 !important;
+    margin: 0 0.5rem;
+}
+div[data-testid="column"].simple-kpi-column:first-child {
+    margin-left: 0;
+}
+div[data-testid="column"].simple-kpi-column:last-child {
+    margin-right: 0;
+}
+.simple-kpi-card {
+    background: var(--background-color);
+    padding: 1.5rem;
+    border-radius: 1rem;
+    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+    height: 100%;
+    display: flex;
+    flex-direction: column;
+    justify-content: space-between; /* Align items for cards without trends */
+}
+.simple-kpi-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 6px 25px rgba(0,0,0,0.15);
+}
+.simple-kpi-header { /* Renamed for clarity */
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+.simple-kpi-label { /* Renamed */
+    font-size: 0.875rem;
+    color: var(--text-color-secondary);
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+}
+.simple-kpi-value { /* Renamed */
+    font-size: 2rem;
+    font-weight: bold;
+    color: var(--text-color);
+    margin: 0.5rem 0;
+    text-align: center;
+    line-height: 1.2;
+    flex-grow: 1; /* Allow value to take more space */
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+.simple-kpi-badge { /* Renamed */
+    background: #3b82f6; /* Example color, can be dynamic */
+    color: white !important; /* Ensure white text */
+    padding: 0.25rem 0.75rem;
+    border-radius: 9999px;
+    font-size: 0.75rem;
+    font-weight: 500;
+    white-space: nowrap;
+}
+/* Tooltip and help icon styling can be reused from render_kpis */
+/* Make sure .tooltip, .tooltiptext, .help-icon styles are available */
+.tooltip {
+    position: relative;
+    display: inline-block;
+}
+.tooltip .tooltiptext {
+    visibility: hidden;
+    width: 300px;
+    background-color: var(--background-color);
+    color: var(--text-color);
+    text-align: left;
+    border-radius: 0.5rem;
+    padding: 0.75rem;
+    position: fixed; /* Use fixed to avoid being clipped by card */
+    z-index: 9999;
+    /* Positioning logic will be handled by JS if needed, or CSS carefully */
+    left: 50%; 
+    transform: translateX(-50%);
+    bottom: 125%; /* Default above, adjust as needed */
+    margin-top: 0.5rem; /* Spacing */
+    opacity: 0;
+    transition: opacity 0.3s;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+    border: 1px solid var(--border-color, #e5e7eb);
+}
+.tooltip:hover .tooltiptext {
+    visibility: visible;
+    opacity: 1;
+}
+ .tooltip .tooltiptext::before { /* Arrow for tooltip */
+    content: "";
+    position: absolute;
+    top: 100%; /* Arrow at the bottom of tooltip */
+    left: 50%;
+    margin-left: -5px;
+    border-width: 5px;
+    border-style: solid;
+    border-color: var(--background-color) transparent transparent transparent;
+}
+.help-icon {
+    color: var(--text-color-secondary);
+    cursor: help;
+    font-size: 1rem;
+    width: 1.25rem;
+    height: 1.25rem;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    border-radius: 50%;
+    background: var(--background-color-secondary, #f3f4f6);
+    transition: all 0.2s ease;
+}
+.help-icon:hover {
+    background: var(--background-color-tertiary, #e5e7eb);
+}
+ @media (max-width: 768px) {
+    div[data-testid="column"].simple-kpi-column {
+        margin: 0.5rem 0;
+    }
+    .simple-kpi-card {
+        padding: 1rem;
+    }
+    .simple-kpi-value {
+        font-size: 1.5rem;
+    }
+    .tooltip .tooltiptext {
+        width: 250px;
+    }
+}
+</style>
+"""
+
+def inject_kpi_css() -> None:
+    """Inject the KPI card stylesheets into the page.
+    
+    Call once per script run (from the app entry point) before any KPI cards
+    are rendered. Both card variants are sent in a single markdown element.
+    """
+    st.markdown(_KPI_CARD_CSS + _SIMPLE_KPI_CARD_CSS, unsafe_allow_html=True)
+
 def clean_trend_data(series: Optional[pd.Series]) -> Optional[pd.Series]:
     """Clean trend data by handling NaN, inf, and out-of-range values.
     
@@ -88,169 +403,7 @@ def render_kpis(
     # Create columns for KPI cards
     cols = st.columns(columns)
     
-    # Add custom CSS for KPI cards
-    st.markdown("""
-    <style>
-    div[data-testid="column"] {
-        background: var(--background-color);
-        border-radius: 1rem;
-        padding: 0 !important;
-        margin: 0 0.5rem;
-    }
-    div[data-testid="column"]:first-child {
-        margin-left: 0;
-    }
-    div[data-testid="column"]:last-child {
-        margin-right: 0;
-    }
-    .kpi-card {
-        background: var(--background-color);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-    }
-    .kpi-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 25px rgba(0,0,0,0.15);
-    }
-    .kpi-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    .kpi-label {
-        font-size: 0.875rem;
-        color: var(--text-color-secondary);
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    .kpi-value {
-        font-size: 2rem;
-        font-weight: bold;
-        color: var(--text-color);
-        margin: 0.5rem 0;
-        text-align: center;
-        line-height: 1.2;
-    }
-    .kpi-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        white-space: nowrap;
-    }
-    .kpi-trend {
-        display: flex;
-        align-items: center;
-        margin-top: auto;
-        font-weight: 600;
-        font-size: 0.875rem;
-        text-align: center;
-        justify-content: center;
-        gap: 0.25rem;
-        padding-top: 0.5rem;
-    }
-    .kpi-trend.positive {
-        color: #16a34a !important;
-    }
-    .kpi-trend.negative {
-        color: #dc2626 !important;
-    }
-    .kpi-trend-text {
-        color: var(--text-color-secondary);
-        font-weight: normal;
-        font-size: 0.875rem;
-    }
-    .kpi-chart {
-        margin: 1rem 0;
-        text-align: center;
-        min-height: 40px;
-        flex-grow: 1;
-    }
-    .help-icon {
-        color: var(--text-color-secondary);
-        cursor: help;
-        font-size: 1rem;
-        width: 1.25rem;
-        height: 1.25rem;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        border-radius: 50%;
-        background: var(--background-color-secondary, #f3f4f6);
-        transition: all 0.2s ease;
-    }
-    .help-icon:hover {
-        background: var(--background-color-tertiary, #e5e7eb);
-    }
-    .tooltip {
-        position: relative;
-        display: inline-block;
-    }
-    .tooltip .tooltiptext {
-        visibility: hidden;
-        width: 300px;
-        background-color: var(--background-color);
-        color: var(--text-color);
-        text-align: left;
-        border-radius: 0.5rem;
-        padding: 0.75rem;
-        position: fixed;
-        z-index: 9999;
-        top: auto;
-        bottom: auto;
-        left: 50%;
-        transform: translateX(-50%);
-        margin-top: 0.5rem;
-        opacity: 0;
-        transition: opacity 0.3s;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        border: 1px solid var(--border-color, #e5e7eb);
-    }
-    .tooltip:hover .tooltiptext {
-        visibility: visible;
-        opacity: 1;
-    }
-    .tooltip .tooltiptext::before {
-        content: "";
-        position: absolute;
-        bottom: 100%;
-        left: 50%;
-        margin-left: -5px;
-        border-width: 5px;
-        border-style: solid;
-        border-color: transparent transparent var(--background-color) transparent;
-    }
-    @media (max-width: 768px) {
-        div[data-testid="column"] {
-            margin: 0.5rem 0;
-        }
-        .kpi-card {
-            padding: 1rem;
-        }
-        .kpi-value {
-            font-size: 1.5rem;
-        }
-        .kpi-trend {
-            font-size: 0.75rem;
-        }
-        .kpi-trend-text {
-            font-size: 0.75rem;
-        }
-        .tooltip .tooltiptext {
-            width: 250px;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Card styles are injected once per run by inject_kpi_css()
     
     # Render each KPI in its column
     for i, kpi in enumerate(kpis):
@@ -282,7 +435,7 @@ def render_kpis(
                     <div class="kpi-badge">Weekly</div>
                 </div>
                 <div class="kpi-value">{kpi["value"]}</div>
-                {f'<div class="kpi-chart"><img src="data:image/png;base64,{sparkline_img}" style="width:100%; height:auto;" /></div>' if sparkline_img else ''}
+                {f'<div class="kpi-chart"><img src="data:image/png;base64,{sparkline_img}" /></div>' if sparkline_img else ''}
                 <div class="kpi-trend {trend_class}">
                     {trend_arrow} {abs(delta):.1f}% 
                     <span class="kpi-trend-text">since last week</span>
@@ -309,147 +462,7 @@ def render_simple_kpis(
     # Create columns for KPI cards
     cols = st.columns(columns)
     
-    # Add custom CSS for KPI cards (can reuse or adapt existing if needed)
-    # For simplicity, this example reuses the existing CSS from render_kpis.
-    # If significantly different styling is needed, a new style block can be added.
-    # Ensure the CSS in render_kpis is general enough or add specific styles here.
-    # Adding a slightly modified CSS for simple cards
-    st.markdown("""
-    <style>
-    /* General column styling from render_kpis - can be shared or redefined */
-    div[data-testid="column"].simple-kpi-column { /* Add a specific class if needed */
-        background: var(--background-color);
-        border-radius: 1rem;
-        padding: 0 !important;
-        margin: 0 0.5rem;
-    }
-    div[data-testid="column"].simple-kpi-column:first-child {
-        margin-left: 0;
-    }
-    div[data-testid="column"].simple-kpi-column:last-child {
-        margin-right: 0;
-    }
-    .simple-kpi-card {
-        background: var(--background-color);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between; /* Align items for cards without trends */
-    }
-    .simple-kpi-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 25px rgba(0,0,0,0.15);
-    }
-    .simple-kpi-header { /* Renamed for clarity */
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    .simple-kpi-label { /* Renamed */
-        font-size: 0.875rem;
-        color: var(--text-color-secondary);
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    .simple-kpi-value { /* Renamed */
-        font-size: 2rem;
-        font-weight: bold;
-        color: var(--text-color);
-        margin: 0.5rem 0;
-        text-align: center;
-        line-height: 1.2;
-        flex-grow: 1; /* Allow value to take more space */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    .simple-kpi-badge { /* Renamed */
-        background: #3b82f6; /* Example color, can be dynamic */
-        color: white !important; /* Ensure white text */
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        white-space: nowrap;
-    }
-    /* Tooltip and help icon styling can be reused from render_kpis */
-    /* Make sure .tooltip, .tooltiptext, .help-icon styles are available */
-    .tooltip {
-        position: relative;
-        display: inline-block;
-    }
-    .tooltip .tooltiptext {
-        visibility: hidden;
-        width: 300px;
-        background-color: var(--background-color);
-        color: var(--text-color);
-        text-align: left;
-        border-radius: 0.5rem;
-        padding: 0.75rem;
-        position: fixed; /* Use fixed to avoid being clipped by card */
-        z-index: 9999;
-        /* Positioning logic will be handled by JS if needed, or CSS carefully */
-        left: 50%; 
-        transform: translateX(-50%);
-        bottom: 125%; /* Default above, adjust as needed */
-        margin-top: 0.5rem; /* Spacing */
-        opacity: 0;
-        transition: opacity 0.3s;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        border: 1px solid var(--border-color, #e5e7eb);
-    }
-    .tooltip:hover .tooltiptext {
-        visibility: visible;
-        opacity: 1;
-    }
-     .tooltip .tooltiptext::before { /* Arrow for tooltip */
-        content: "";
-        position: absolute;
-        top: 100%; /* Arrow at the bottom of tooltip */
-        left: 50%;
-        margin-left: -5px;
-        border-width: 5px;
-        border-style: solid;
-        border-color: var(--background-color) transparent transparent transparent;
-    }
-    .help-icon {
-        color: var(--text-color-secondary);
-        cursor: help;
-        font-size: 1rem;
-        width: 1.25rem;
-        height: 1.25rem;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        border-radius: 50%;
-        background: var(--background-color-secondary, #f3f4f6);
-        transition: all 0.2s ease;
-    }
-    .help-icon:hover {
-        background: var(--background-color-tertiary, #e5e7eb);
-    }
-     @media (max-width: 768px) {
-        div[data-testid="column"].simple-kpi-column {
-            margin: 0.5rem 0;
-        }
-        .simple-kpi-card {
-            padding: 1rem;
-        }
-        .simple-kpi-value {
-            font-size: 1.5rem;
-        }
-        .tooltip .tooltiptext {
-            width: 250px;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Card styles are injected once per run by inject_kpi_css()
     
     # Render each KPI in its column
     for i, kpi in enumerate(kpis):
@@ -0,0 +1,135 @@
+"""
+Numeric helpers for preparing time series data for charts.
+"""
+
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+try:
+    import numbagg
+except ImportError:
+    numbagg = None # numbagg not installed, fall back to pandas rolling windows
+
+# Upper bound on the number of points sent to the browser per chart trace
+MAX_CHART_POINTS = 2000
+
+
+def _kernel_dtype(series: pd.Series) -> np.dtype:
+    """Keep float32 input in single precision; everything else is computed in float64."""
+    return np.dtype(np.float32) if series.dtype == np.float32 else np.dtype(np.float64)
+
+
+def move_mean(series: pd.Series, window: int) -> pd.Series:
+    """
+    Trailing moving average, equivalent to series.rolling(window, min_periods=1).mean().
+    
+    Uses numbagg's compiled moving-window kernels when available.
+    
+    Args:
+        series: Series to smooth
+        window: Window size in rows
+        
+    Returns:
+        Smoothed float Series with the original index
+    """
+    if numbagg is None:
+        return series.rolling(window=window, min_periods=1).mean()
+    values = series.to_numpy(dtype=_kernel_dtype(series))
+    return pd.Series(numbagg.move_mean(values, window, min_count=1), index=series.index, name=series.name)
+
+
+def move_sum(series: pd.Series, window: int) -> pd.Series:
+    """
+    Trailing moving sum, equivalent to series.rolling(window, min_periods=1).sum().
+    
+    Uses numbagg's compiled moving-window kernels when available.
+    
+    Args:
+        series: Series to aggregate
+        window: Window size in rows
+        
+    Returns:
+        Float Series with the original index
+    """
+    if numbagg is None:
+        return series.rolling(window=window, min_periods=1).sum()
+    values = series.to_numpy(dtype=_kernel_dtype(series))
+    return pd.Series(numbagg.move_sum(values, window, min_count=1), index=series.index, name=series.name)
+
+
+def _as_float_axis(x: np.ndarray) -> np.ndarray:
+    """Convert an x-axis array (numeric, datetime64 or date objects) to float64."""
+    if x.dtype.kind in 'biuf':
+        return x.astype(np.float64)
+    if x.dtype.kind != 'M':
+        x = pd.to_datetime(x).to_numpy()
+    return x.astype('datetime64[ns]').view(np.int64).astype(np.float64)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select point indices with the Largest-Triangle-Three-Buckets algorithm.
+    
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously selected point and the mean of the next bucket
+    is kept. This preserves peaks and troughs far better than taking every Nth
+    point.
+    
+    Args:
+        x: X-axis values (numeric, datetime64 or date objects), sorted ascending
+        y: Y-axis values
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    xf = _as_float_axis(np.asarray(x))
+    yf = np.asarray(y, dtype=np.float64)
+    
+    # n_out - 1 edges give n_out - 2 buckets covering points 1 .. n - 2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = xf[next_start:next_end].mean()
+        avg_y = yf[next_start:next_end].mean()
+        
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[start:end] - yf[a])
+            - (xf[a] - xf[start:end]) * (avg_y - yf[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return indices
+
+
+def lttb_downsample(x, y, n_out: int = MAX_CHART_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample an (x, y) series to at most n_out points using LTTB.
+    
+    Series that already fit within n_out points are returned unchanged.
+    
+    Args:
+        x: X-axis values, sorted ascending
+        y: Y-axis values
+        n_out: Maximum number of points to return
+        
+    Returns:
+        Tuple of (x, y) NumPy arrays
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if len(y) <= n_out:
+        return x, y
+    idx = lttb_indices(x, y, n_out)
+    return x[idx], y[idx]